@@ -1,5 +1,6 @@
 """Encoder wrapper for HandBrake and FFmpeg"""
 
+import json
 import logging
 import re
 import shlex
@@ -8,6 +9,7 @@ import sys
 import threading
 import time
 import os
+import traceback
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List, Tuple
 from queue import Queue, Empty
@@ -24,6 +26,15 @@ OUTPUT_FILE_WAIT_MAX_RETRIES = 10
 OUTPUT_FILE_INITIAL_DELAY_SEC = 0.1
 OUTPUT_FILE_STABILITY_DELAY_SEC = 0.15
 
+# Encoder output parsing, run on every progress line
+_FFMPEG_DURATION_RE = re.compile(r'Duration:\s*(\d{2}:\d{2}:\d{2}\.\d{2})')
+_FFMPEG_TIME_RE = re.compile(r'time=(\d{2}:\d{2}:\d{2}\.\d{2})')
+_FFMPEG_SPEED_RE = re.compile(r'speed=\s*([\d.]+)x')
+_FFMPEG_FPS_RE = re.compile(r'fps=\s*([\d.]+)')
+_HANDBRAKE_PERCENT_RE = re.compile(r'Encoding: task \d+ of \d+, ([\d.]+) %')
+_HANDBRAKE_ETA_RE = re.compile(r'ETA (\d{2}:\d{2}:\d{2})')
+_HANDBRAKE_FPS_RE = re.compile(r'([\d.]+) fps')
+
 # Subtitle codec grouping
 TEXT_SUBTITLE_CODECS = {"subrip", "ass", "ssa", "webvtt"}
 BITMAP_SUBTITLE_CODECS = {"hdmv_pgs_subtitle", "pgssub", "dvd_subtitle"}
@@ -151,7 +162,6 @@ def detect_subtitles(video_file: Path, ffprobe_path: Optional[str] = None) -> Su
         result = subprocess.run(**run_kw)
 
         if result.returncode == 0:
-            import json
             data = json.loads(result.stdout)
             streams = data.get("streams", [])
 
@@ -469,7 +479,6 @@ class Encoder:
                 return False
             except OSError as e:
                 self._log("ERROR", f"Failed to start subprocess: {str(e)}")
-                import traceback
                 self._log("ERROR", f"Traceback: {traceback.format_exc()}")
                 return False
 
@@ -510,7 +519,8 @@ class Encoder:
 
                 self._drain_stdout_queue(stdout_queue, encoder_name)
                 self._drain_stderr_queue(stderr_queue, encoder_name)
-                time.sleep(0.05)
+                # Returns as soon as stop() sets the event instead of sleeping out the interval.
+                self._stop_event.wait(0.05)
 
             # stop() may have taskkilled from another thread while we were sleeping
             if self._stop_event.is_set():
@@ -564,7 +574,6 @@ class Encoder:
                 
         except Exception as e:
             self._log("ERROR", f"Error encoding: {str(e)}")
-            import traceback
             self._log("ERROR", f"Traceback: {traceback.format_exc()}")
             with self._process_lock:
                 proc = self._current_process
@@ -643,7 +652,7 @@ class Encoder:
     
     def _parse_duration_from_line(self, line: str) -> Optional[float]:
         """Parse duration from FFmpeg output line like 'Duration: 00:23:45.67'"""
-        duration_match = re.search(r'Duration:\s*(\d{2}:\d{2}:\d{2}\.\d{2})', line)
+        duration_match = _FFMPEG_DURATION_RE.search(line)
         if duration_match:
             return self._time_to_seconds(duration_match.group(1))
         return None
@@ -661,9 +670,9 @@ class Encoder:
                     self._log("DEBUG", f"Detected video duration: {duration:.2f} seconds")
             
             # Parse FFmpeg progress: time=00:00:05.12 speed=1.5x fps=40.0
-            time_match = re.search(r'time=(\d{2}:\d{2}:\d{2}\.\d{2})', line)
-            speed_match = re.search(r'speed=\s*([\d.]+)x', line)
-            fps_match = re.search(r'fps=\s*([\d.]+)', line)
+            time_match = _FFMPEG_TIME_RE.search(line)
+            speed_match = _FFMPEG_SPEED_RE.search(line)
+            fps_match = _FFMPEG_FPS_RE.search(line)
             
             if time_match:
                 progress.time = time_match.group(1)
@@ -696,9 +705,9 @@ class Encoder:
         
         elif encoder_name == "HandBrake":
             # Parse HandBrake progress: Encoding: task 1 of 1, 45.67 % (12.34 fps, avg 11.23 fps, ETA 00:05:30)
-            percent_match = re.search(r'Encoding: task \d+ of \d+, ([\d.]+) %', line)
-            eta_match = re.search(r'ETA (\d{2}:\d{2}:\d{2})', line)
-            fps_match = re.search(r'([\d.]+) fps', line)
+            percent_match = _HANDBRAKE_PERCENT_RE.search(line)
+            eta_match = _HANDBRAKE_ETA_RE.search(line)
+            fps_match = _HANDBRAKE_FPS_RE.search(line)
             
             if percent_match:
                 progress.percent = float(percent_match.group(1))
@@ -6,6 +6,17 @@ from .preset_parser import PresetParser
 from utils.config import config
 from utils.ffmpeg_encoding import resolve_pix_fmt
 
+# One-pass equivalent of the escaping steps documented in _escape_ffmpeg_filter_path.
+_FILTER_PATH_TRANS = str.maketrans({
+    "\\": "/",
+    "'": "\\'",
+    ":": "\\:",
+    "[": "\\[",
+    "]": "\\]",
+    ";": "\\;",
+    ",": "\\,",
+})
+
 
 def _escape_ffmpeg_filter_path(path: str) -> str:
     """Escape a file-system path for safe embedding in an FFmpeg -vf filter string.
@@ -22,17 +33,9 @@ def _escape_ffmpeg_filter_path(path: str) -> str:
     # could allow injection into the FFmpeg filtergraph expression.
     if '\n' in path or '\r' in path:
         raise ValueError(f"File path contains illegal newline characters: {path!r}")
-    # Normalise Windows separators — FFmpeg accepts forward slashes on Windows.
-    path = path.replace("\\", "/")
-    # Level 1: characters special inside a single-quoted lavfi option value.
-    path = path.replace("'", "\\'")   # single-quote  → \'
-    path = path.replace(":", "\\:")   # option separator → \:
-    # Level 2: characters special in the filtergraph string itself.
-    path = path.replace("[", "\\[")
-    path = path.replace("]", "\\]")
-    path = path.replace(";", "\\;")
-    path = path.replace(",", "\\,")
-    return path
+    # Normalise Windows separators (FFmpeg accepts forward slashes on Windows),
+    # then escape level 1 (' and :) and level 2 ([ ] ; ,) characters in one pass.
+    return path.translate(_FILTER_PATH_TRANS)
 
 
 class FFmpegTranslator:
@@ -202,6 +205,11 @@ class FFmpegTranslator:
             audio_filter=audio_filter,
             audio_ffmpeg_stream_index=audio_ffmpeg_stream_index,
         )
+        return self.join_command(cmd)
+
+    @staticmethod
+    def join_command(cmd: List[str]) -> str:
+        """Join an argv list into the editable command string (args with spaces are double-quoted)."""
         return " ".join(f'"{arg}"' if " " in arg else arg for arg in cmd)
     
     def get_command_breakdown(
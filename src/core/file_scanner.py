@@ -1,11 +1,22 @@
 """Scan for video files in directories"""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
 from utils.constants import VIDEO_EXTENSIONS
 
 
+@lru_cache(maxsize=1024)
+def _format_file_size(size_bytes: int) -> str:
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.2f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.2f} PB"
+
+
 class FileScanner:
     """Scans directories for video files"""
 
@@ -22,19 +33,51 @@ class FileScanner:
         if not directory.exists() or not directory.is_dir():
             return self.found_files
         
-        candidates: List[Path] = []
-        if recursive:
-            for path in directory.rglob("*"):
-                if path.is_file() and path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    candidates.append(path)
-        else:
-            for path in directory.iterdir():
-                if path.is_file() and path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    candidates.append(path)
-        
-        self.found_files = sorted(set(candidates))
+        self.found_files = sorted(set(self.iter_directory(directory, recursive)))
         return self.found_files
     
+    def iter_directory(self, directory: Path, recursive: bool = True) -> Iterator[Path]:
+        """Yield video files in walk order as they are found (unsorted, no found_files update)"""
+        if not directory.exists() or not directory.is_dir():
+            return
+        paths = directory.rglob("*") if recursive else directory.iterdir()
+        for path in paths:
+            if path.suffix.lower() in self.VIDEO_EXTENSIONS and path.is_file():
+                yield path
+    
+    def iter_directory_sizes(self, directory: Path, recursive: bool = True) -> Iterator[Tuple[Path, int]]:
+        """Like iter_directory, but yields (path, size) from one os.scandir walk.
+
+        The size comes from the directory entry's stat, so callers off the UI thread
+        can hand it to the file list instead of stat'ing every file again there.
+        """
+        if not directory.exists() or not directory.is_dir():
+            return
+        pending = [str(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in self.VIDEO_EXTENSIONS:
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                yield Path(entry.path), size
+    
     def is_video_file(self, file_path: Path) -> bool:
         """Check if a file is a video file"""
         return file_path.suffix.lower() in self.VIDEO_EXTENSIONS
@@ -47,9 +90,5 @@ class FileScanner:
             return 0
     
     def format_file_size(self, size_bytes: int) -> str:
-        """Format file size as human-readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        """Format file size as human-readable string (memoized; the same sizes recur on row updates)"""
+        return _format_file_size(size_bytes)
@@ -1,14 +1,33 @@
 """Package manager integration for auto-installing dependencies"""
 
+import functools
 import os
 import platform
 import subprocess
 import shutil
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from core.subprocess_utils import get_subprocess_kwargs
 
+# Repeat detections within this window reuse the last PATH/fallback scan.
+DETECTION_CACHE_TTL_SEC = 5.0
+
+
+def _detection_cached(check):
+    """Memoize a check_* result on the instance for DETECTION_CACHE_TTL_SEC."""
+    @functools.wraps(check)
+    def wrapper(self) -> Tuple[bool, Optional[str]]:
+        now = time.monotonic()
+        hit = self._detect_cache.get(check.__name__)
+        if hit is not None and now - hit[0] < DETECTION_CACHE_TTL_SEC:
+            return hit[1]
+        result = check(self)
+        self._detect_cache[check.__name__] = (now, result)
+        return result
+    return wrapper
+
 
 class PackageManager:
     """Handles detection and installation of required tools"""
@@ -17,6 +36,11 @@ class PackageManager:
         self.system = platform.system()
         self.is_windows = self.system == "Windows"
         self.is_mac = self.system == "Darwin"
+        self._detect_cache: Dict[str, Tuple[float, Tuple[bool, Optional[str]]]] = {}
+
+    def clear_detection_cache(self) -> None:
+        """Forget cached check_* results (e.g. after installing a tool)."""
+        self._detect_cache.clear()
 
     def _normalize_detected_exe_path(self, path: Optional[str]) -> Optional[str]:
         """Lowercase .exe suffix on Windows (PATH/WinGet often reports .EXE)."""
@@ -50,6 +74,7 @@ class PackageManager:
         
         return None
     
+    @_detection_cached
     def check_ffmpeg(self) -> Tuple[bool, Optional[str]]:
         """Check if FFmpeg is installed (PATH first, then common install locations)."""
         path_names = ("ffmpeg", "ffmpeg.exe") if self.is_windows else ("ffmpeg",)
@@ -74,6 +99,7 @@ class PackageManager:
             return True, self._normalize_detected_exe_path(exe)
         return False, None
 
+    @_detection_cached
     def check_ffprobe(self) -> Tuple[bool, Optional[str]]:
         """Check if ffprobe is installed (PATH first, then same fallbacks as FFmpeg on Windows)."""
         path_names = ("ffprobe", "ffprobe.exe") if self.is_windows else ("ffprobe",)
@@ -98,6 +124,7 @@ class PackageManager:
             return True, self._normalize_detected_exe_path(exe)
         return False, None
     
+    @_detection_cached
     def check_handbrake(self) -> Tuple[bool, Optional[str]]:
         """Check if HandBrake CLI is installed (PATH first)."""
         path_names = ("HandBrakeCLI", "HandBrakeCLI.exe") if self.is_windows else ("HandBrakeCLI",)
@@ -115,6 +142,7 @@ class PackageManager:
         found = self.find_executable(exe, fallback)
         return (True, self._normalize_detected_exe_path(found)) if found else (False, None)
     
+    @_detection_cached
     def check_mkvinfo(self) -> Tuple[bool, Optional[str]]:
         """Check if mkvinfo is installed (PATH first)."""
         path_names = ("mkvinfo", "mkvinfo.exe") if self.is_windows else ("mkvinfo",)
@@ -179,6 +207,7 @@ class PackageManager:
             run_kwargs.update(get_subprocess_kwargs())
             
             result = subprocess.run(**run_kwargs)
+            self.clear_detection_cache()
             
             if result.returncode == 0:
                 return True, f"Successfully installed {package}"
@@ -209,6 +238,7 @@ class PackageManager:
             run_kwargs.update(get_subprocess_kwargs())
             
             result = subprocess.run(**run_kwargs)
+            self.clear_detection_cache()
             
             if result.returncode == 0:
                 return True, f"Successfully installed {package}"
@@ -74,9 +74,9 @@ def sync_lifetime_stats_to_api() -> None:
     try:
         status = _post_stats(base)
         if status != 200:
-            logger.warning(f"Stats API: POST /api/stats returned HTTP {status}")
+            logger.warning("Stats API: POST /api/stats returned HTTP %s", status)
     except Exception as e:
-        logger.debug(f"Stats API sync failed: {e}")
+        logger.debug("Stats API sync failed: %s", e)
 
 
 def schedule_sync_lifetime_stats_if_enabled() -> None:
@@ -87,6 +87,6 @@ def schedule_sync_lifetime_stats_if_enabled() -> None:
         try:
             sync_lifetime_stats_to_api()
         except Exception as e:
-            logger.debug(f"Stats API sync thread error: {e}")
+            logger.debug("Stats API sync thread error: %s", e)
 
     threading.Thread(target=run, daemon=True).start()
@@ -3,18 +3,24 @@
 import logging
 import re
 import subprocess
+import threading
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Pattern, Tuple
+from typing import Callable, Optional, Dict, FrozenSet, Iterator, List, Any, Pattern, Tuple
 import shutil
 
 from core.subprocess_utils import get_subprocess_kwargs
+from core.track_cache import track_cache, track_cache_key
 from utils.config import config
 from utils.ffmpeg_paths import resolve_ffprobe_path
 
 logger = logging.getLogger(__name__)
 
 _REGEX_CACHE_MAX_KEYS = 64
+MKVINFO_TIMEOUT_SEC = 30
 _TRACK_CACHE_MAX_ENTRIES = 256
+# Raw mkvinfo text can be large, so keep fewer (output, tracks) pairs around.
+_OUTPUT_CACHE_MAX_ENTRIES = 8
 
 # Safety caps for mkvinfo output parsing.
 # A legitimate video file rarely has more than a handful of tracks; these limits
@@ -23,6 +29,26 @@ _TRACK_CACHE_MAX_ENTRIES = 256
 _MKVINFO_MAX_LINES = 10_000   # lines of text to consider
 _MKVINFO_MAX_TRACKS = 64      # track dicts to accumulate
 
+# mkvinfo line patterns, matched against every output line.
+_MKVINFO_FIELD_LINE_RE = re.compile(r"^\|\s{2}\+")
+_MKVINFO_TRACK_NUMBER_RE = re.compile(r'\+ Track number: (\d+) \(track ID for mkvmerge & mkvextract: (\d+)\)')
+_MKVINFO_TRACK_TYPE_RE = re.compile(r'\+ Track type: (audio|subtitles|video)')
+_MKVINFO_LANGUAGE_IETF_RE = re.compile(r'\+ Language \(IETF BCP 47\): ([^\s]+)')
+_MKVINFO_LANGUAGE_RE = re.compile(r'\+ Language: (\w+)')
+_MKVINFO_NAME_RE = re.compile(r'\+ Name: (.+)')
+_SIGNS_BRACKET_RE = re.compile(r"\[signs\]", re.I)
+
+
+def _language_matches(language: str, tags: FrozenSet[str]) -> bool:
+    """True if a lowercased tag equals the language or a prefix of it cut at '-' or '_' (e.g. "eng-eng")."""
+    lang = language.lower()
+    if lang in tags:
+        return True
+    for i, ch in enumerate(lang):
+        if ch in "-_" and lang[:i] in tags:
+            return True
+    return False
+
 
 class TrackAnalyzer:
     """Analyzes video files to detect audio and subtitle tracks"""
@@ -32,6 +58,7 @@ class TrackAnalyzer:
         self.ffprobe_path = ffprobe_path or self._find_ffprobe()
         self._regex_cache: Dict[tuple, List[Pattern[str]]] = {}
         self._track_cache: Dict[Tuple[str, float], Dict[str, Any]] = {}
+        self._output_cache: Dict[Tuple[str, int], Tuple[Optional[str], Dict[str, Any]]] = {}
 
     def _compiled_regexes(self, pattern_strings: List[str]) -> List[Pattern[str]]:
         key = tuple(pattern_strings)
@@ -50,9 +77,23 @@ class TrackAnalyzer:
                     logger.warning(
                         "Invalid regex pattern %r in config (skipped): %s", p, exc
                     )
-            cached = compiled
+            cached = self._combine_regexes(compiled)
             self._regex_cache[key] = cached
         return cached
+
+    @staticmethod
+    def _combine_regexes(compiled: List[Pattern[str]]) -> List[Pattern[str]]:
+        """Fold the patterns into one alternation so a name is searched once, not per pattern.
+
+        Patterns with groups (backreferences would renumber) or inline flags that
+        cannot move off the front are left as separate regexes.
+        """
+        if len(compiled) < 2 or any(c.groups for c in compiled):
+            return compiled
+        try:
+            return [re.compile("|".join(f"(?:{c.pattern})" for c in compiled), re.IGNORECASE)]
+        except re.error:
+            return compiled
     
     def get_mkvinfo_output(self, file_path: Path) -> Optional[str]:
         """Get raw mkvinfo output for debugging"""
@@ -78,6 +119,56 @@ class TrackAnalyzer:
         except (subprocess.TimeoutExpired, OSError, FileNotFoundError):
             return None
     
+    def iter_mkvinfo_output(self, file_path: Path, timeout: float = MKVINFO_TIMEOUT_SEC) -> Iterator[str]:
+        """Yield raw mkvinfo output line by line as mkvinfo produces it.
+
+        Unlike ``get_mkvinfo_output`` the full stdout is never buffered, so
+        callers can show output progressively for very large files. stderr is
+        merged into the stream. mkvinfo is killed once it runs past ``timeout``
+        seconds and ``subprocess.TimeoutExpired`` is raised; a non-zero exit
+        raises ``subprocess.CalledProcessError`` after its output was yielded.
+        Closing the generator early terminates mkvinfo.
+        """
+        if not self.mkvinfo_path:
+            return
+        args = [self.mkvinfo_path, str(file_path)]
+        popen_kwargs = {
+            'args': args,
+            'stdin': subprocess.DEVNULL,
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.STDOUT,
+            'text': True,
+            'encoding': 'utf-8',
+            'errors': 'replace',
+            'bufsize': 1,
+        }
+        popen_kwargs.update(get_subprocess_kwargs())
+        proc = subprocess.Popen(**popen_kwargs)
+        # A blocked read cannot check a deadline, so a timer kills mkvinfo instead.
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                yield line
+            proc.wait()
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(args, timeout)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+
     def _find_mkvinfo(self) -> Optional[str]:
         """Find mkvinfo executable"""
         return shutil.which("mkvinfo") or shutil.which("mkvinfo.exe")
@@ -112,12 +203,79 @@ class TrackAnalyzer:
         else:
             return {"audio": None, "subtitle": None, "error": "No analyzer available"}
 
+    def analyze_with_output(
+        self, file_path: Path, on_output: Optional[Callable[[str], None]] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Return ``(raw_mkvinfo_output, tracks)`` from a single streamed mkvinfo run.
+
+        Used by the Debug tab, which needs both the raw text and the parsed
+        tracks. mkvinfo runs on any file; each output line goes to ``on_output``
+        as it arrives and the collected text is parsed once mkvinfo exits.
+        Non-MKV files take their tracks from ``analyze_tracks``. Successful
+        results are cached by path + mtime_ns, and a cached raw output is replayed
+        to ``on_output`` line by line. An exception raised by ``on_output``
+        stops mkvinfo and propagates.
+        """
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        cache_key = (str(file_path), mtime_ns)
+        cached = self._output_cache.get(cache_key)
+        if cached is not None:
+            if on_output is not None and cached[0]:
+                for line in cached[0].splitlines(keepends=True):
+                    on_output(line)
+            return cached
+        is_mkv = file_path.suffix.lower() == ".mkv"
+        # Keyed before the run so a file rewritten meanwhile is not cached under its new stat.
+        key = track_cache_key(file_path) if is_mkv else None
+        lines: List[str] = []
+        error: Optional[str] = None
+        if not self.mkvinfo_path:
+            error = "mkvinfo not found"
+        else:
+            try:
+                with closing(self.iter_mkvinfo_output(file_path)) as output:
+                    for line in output:
+                        lines.append(line)
+                        if on_output is not None:
+                            on_output(line)
+            except subprocess.TimeoutExpired:
+                error = "mkvinfo timed out"
+            except subprocess.CalledProcessError:
+                error = "mkvinfo failed"
+            except OSError as e:
+                error = str(e)
+        raw = "".join(lines) or None
+        if not is_mkv or not self.mkvinfo_path:
+            tracks = self.analyze_tracks(file_path)
+        elif error:
+            tracks = {"audio": None, "subtitle": None, "error": error}
+        else:
+            parsed = self._parse_mkvinfo_tracks(raw or "")
+            if key:
+                track_cache.put(key, parsed)
+            tracks = self._select_tracks(parsed)
+        result = (raw, tracks)
+        if error is None:
+            if len(self._output_cache) >= _OUTPUT_CACHE_MAX_ENTRIES:
+                self._output_cache.clear()
+            self._output_cache[cache_key] = result
+        return result
+
     def clear_track_cache(self) -> None:
-        """Invalidate all cached track analysis results."""
+        """Invalidate all cached track analysis results, including the persisted track lists."""
         self._track_cache.clear()
+        self._output_cache.clear()
+        track_cache.clear()
     
     def _analyze_mkv_tracks(self, file_path: Path) -> Dict[str, Optional[int]]:
-        """Analyze MKV tracks using mkvinfo"""
+        """Analyze MKV tracks using mkvinfo, reusing the persisted track list when the file is unchanged"""
+        key = track_cache_key(file_path)
+        tracks = track_cache.get(key) if key else None
+        if tracks is not None:
+            return self._select_tracks(tracks)
         try:
             # Hide console window on Windows (for release builds)
             run_kwargs = {
@@ -142,7 +300,10 @@ class TrackAnalyzer:
                     "error": "mkvinfo output unavailable",
                 }
             
-            return self._parse_mkvinfo_output(result.stdout)
+            tracks = self._parse_mkvinfo_tracks(result.stdout)
+            if key:
+                track_cache.put(key, tracks)
+            return self._select_tracks(tracks)
         except subprocess.TimeoutExpired:
             return {"audio": None, "subtitle": None, "error": "mkvinfo timed out"}
         except (OSError, FileNotFoundError) as e:
@@ -150,10 +311,10 @@ class TrackAnalyzer:
     
     def _parse_mkvinfo_output(self, output: str) -> Dict[str, Any]:
         """Parse mkvinfo output to find tracks"""
-        audio_track = None
-        subtitle_track = None
+        return self._select_tracks(self._parse_mkvinfo_tracks(output))
 
-        # Collect all tracks first
+    def _parse_mkvinfo_tracks(self, output: str) -> List[Dict[str, Any]]:
+        """Collect id/type/language/name for each track entry in mkvinfo output."""
         tracks = []
         lines = output.splitlines()
 
@@ -175,10 +336,10 @@ class TrackAnalyzer:
             line_clean = line.lstrip('| \t')
             # mkvinfo nests Tags after Tracks; Tag "Simple" lines use deeper indent than Track entry
             # fields. lstrip('| \t') hides that, so Tag "+ Name: DURATION" was overwriting real track names.
-            is_track_entry_field_line = bool(re.match(r"^\|\s{2}\+", line))
+            is_track_entry_field_line = bool(_MKVINFO_FIELD_LINE_RE.match(line))
 
             # Detect track start
-            match = re.search(r'\+ Track number: (\d+) \(track ID for mkvmerge & mkvextract: (\d+)\)', line_clean)
+            match = _MKVINFO_TRACK_NUMBER_RE.search(line_clean)
             if match:
                 # Save previous track if exists
                 if current_track is not None:
@@ -208,25 +369,25 @@ class TrackAnalyzer:
                 continue
             
             # Detect track type
-            match = re.search(r'\+ Track type: (audio|subtitles|video)', line_clean)
+            match = _MKVINFO_TRACK_TYPE_RE.search(line_clean)
             if match and is_track_entry_field_line:
                 current_track["type"] = match.group(1)
                 continue
             
             # Detect language (prefer IETF BCP 47 format)
             # IETF BCP 47 can have hyphens, e.g., "eng-eng"
-            match = re.search(r'\+ Language \(IETF BCP 47\): ([^\s]+)', line_clean)
+            match = _MKVINFO_LANGUAGE_IETF_RE.search(line_clean)
             if match and is_track_entry_field_line:
                 current_track["language"] = match.group(1)
                 continue
             
-            match = re.search(r'\+ Language: (\w+)', line_clean)
+            match = _MKVINFO_LANGUAGE_RE.search(line_clean)
             if match and current_track["language"] is None and is_track_entry_field_line:
                 current_track["language"] = match.group(1)
                 continue
             
             # Detect track name
-            match = re.search(r'\+ Name: (.+)', line_clean)
+            match = _MKVINFO_NAME_RE.search(line_clean)
             if match and is_track_entry_field_line:
                 current_track["name"] = match.group(1).strip()
                 continue
@@ -234,6 +395,12 @@ class TrackAnalyzer:
         # Save last track
         if current_track is not None:
             tracks.append(current_track)
+        return tracks
+
+    def _select_tracks(self, tracks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pick the English audio and Signs & Songs subtitle from parsed tracks (uses Settings patterns)."""
+        audio_track = None
+        subtitle_track = None
 
         # Process tracks to find English audio and Signs & Songs subtitle.
         # Audio selection uses 1-based index among audio streams only (first audio = 1) so it
@@ -283,16 +450,12 @@ class TrackAnalyzer:
     def _is_english_track(self, language: Optional[str], name: Optional[str]) -> bool:
         """Check if a track is English using configurable patterns"""
         # Get configurable patterns
-        lang_tags = config.get_audio_language_tags()
         name_patterns = config.get_audio_name_patterns()
         exclude_patterns = config.get_audio_exclude_patterns()
         
-        # Check language tag (handle cases like "eng-eng" by checking if it starts with or contains the tag)
-        if language:
-            lang_lower = language.lower()
-            for tag in lang_tags:
-                if lang_lower == tag.lower() or lang_lower.startswith(tag.lower() + "-") or lang_lower.startswith(tag.lower() + "_"):
-                    return True
+        # Check language tag (handle cases like "eng-eng" by matching the part before "-" or "_")
+        if language and _language_matches(language, config.get_audio_language_tag_set()):
+            return True
         
         # Check name for English indicators (but not excluded patterns)
         if name:
@@ -320,7 +483,7 @@ class TrackAnalyzer:
             if compiled.search(name):
                 return True
         # Common release naming (e.g. English[Signs]) does not match legacy patterns like Signs$.
-        if re.search(r"\[signs\]", name, re.I):
+        if _SIGNS_BRACKET_RE.search(name):
             return True
         return False
     
@@ -328,27 +491,17 @@ class TrackAnalyzer:
         """True if the track's language tag is English (no exclude check). Used when Japanese-audio mode needs first English sub."""
         if not language:
             return False
-        lang_lower = language.lower()
-        for tag in config.get_subtitle_language_tags():
-            if lang_lower == tag.lower() or lang_lower.startswith(tag.lower() + "-") or lang_lower.startswith(tag.lower() + "_"):
-                return True
-        return False
+        return _language_matches(language, config.get_subtitle_language_tag_set())
 
     def _is_english_subtitle_track(self, language: Optional[str], name: Optional[str]) -> bool:
         """Check if a subtitle track is English using configurable patterns (language + exclude by name)."""
-        lang_tags = config.get_subtitle_language_tags()
-        exclude_patterns = config.get_subtitle_exclude_patterns()
-
-        if language:
-            lang_lower = language.lower()
-            for tag in lang_tags:
-                if lang_lower == tag.lower() or lang_lower.startswith(tag.lower() + "-") or lang_lower.startswith(tag.lower() + "_"):
-                    if name:
-                        for compiled in self._compiled_regexes(exclude_patterns):
-                            if compiled.search(name):
-                                return False
-                    return True
-        return False
+        if not language or not _language_matches(language, config.get_subtitle_language_tag_set()):
+            return False
+        if name:
+            for compiled in self._compiled_regexes(config.get_subtitle_exclude_patterns()):
+                if compiled.search(name):
+                    return False
+        return True
     
     def _analyze_with_ffprobe(self, file_path: Path) -> Dict[str, Optional[int]]:
         """Analyze tracks using ffprobe (fallback)"""
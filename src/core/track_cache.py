@@ -0,0 +1,121 @@
+"""Persistent cache of parsed mkvinfo track lists (JSON sidecar in the config dir)"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.config import config
+
+logger = logging.getLogger(__name__)
+
+TRACK_CACHE_FILE_NAME = "track_cache.json"
+TRACK_CACHE_SAVE_DEBOUNCE_SEC = 2.0
+# One entry per source path; the oldest entries are dropped past this size.
+_TRACK_CACHE_MAX_PATHS = 5000
+
+TrackCacheKey = Tuple[str, int, int]
+
+
+def track_cache_key(file_path: Path) -> Optional[TrackCacheKey]:
+    """(path, mtime_ns, size) for a file, or None when it cannot be stat'ed."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return (str(file_path), st.st_mtime_ns, st.st_size)
+
+
+class TrackCache:
+    """Stores the raw track list per file so repeat runs skip the mkvinfo process.
+
+    Only parsed tracks are kept, not the audio/subtitle picks: those depend on the
+    language and name patterns in Settings and are recomputed on every hit.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+    def _ensure_loaded_locked(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError, UnicodeError) as e:
+            logger.warning("Ignoring unreadable track cache %s: %s", self.cache_file, e)
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def get(self, key: TrackCacheKey) -> Optional[List[Dict[str, Any]]]:
+        path, mtime_ns, size = key
+        with self._lock:
+            self._ensure_loaded_locked()
+            entry = self._entries.get(path)
+        if not entry or entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+            return None
+        tracks = entry.get("tracks")
+        return tracks if isinstance(tracks, list) else None
+
+    def put(self, key: TrackCacheKey, tracks: List[Dict[str, Any]]) -> None:
+        path, mtime_ns, size = key
+        with self._lock:
+            self._ensure_loaded_locked()
+            self._entries.pop(path, None)
+            if len(self._entries) >= _TRACK_CACHE_MAX_PATHS:
+                del self._entries[next(iter(self._entries))]
+            self._entries[path] = {"mtime_ns": mtime_ns, "size": size, "tracks": tracks}
+            self._schedule_save_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded = True
+            self._entries = {}
+            self._schedule_save_locked()
+
+    def _schedule_save_locked(self) -> None:
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+
+        def run_save() -> None:
+            with self._lock:
+                self._save_timer = None
+                self._write_locked()
+
+        timer = threading.Timer(TRACK_CACHE_SAVE_DEBOUNCE_SEC, run_save)
+        timer.daemon = True
+        self._save_timer = timer
+        timer.start()
+
+    def _write_locked(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+        except OSError as e:
+            logger.warning("Could not save track cache: %s", e)
+
+    def flush(self) -> None:
+        """Write pending changes immediately (e.g. before app exit)."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._write_locked()
+
+
+track_cache = TrackCache(config.config_dir / TRACK_CACHE_FILE_NAME)
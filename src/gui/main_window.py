@@ -18,6 +18,7 @@ from PyQt6.QtWidgets import (
 
 from core.notifications import BatchNotification
 from core.package_manager import PackageManager
+from core.track_cache import track_cache
 from storage import dispose_engine
 from utils.config import config
 from utils.logger import logger
@@ -110,6 +111,7 @@ class MainWindow(QMainWindow):
         self._tab_index_files = self.tab_widget.indexOf(self.files_tab)
         self._tab_index_settings = self.tab_widget.indexOf(self.settings_tab)
         self._tab_index_ffmpeg = self.tab_widget.indexOf(self.ffmpeg_tab)
+        self._tab_index_handbrake = self.tab_widget.indexOf(self.handbrake_tab)
         self._tab_index_debug = self.tab_widget.indexOf(self.debug_tab)
         self._tab_index_stats = self.tab_widget.indexOf(self.stats_tab)
         self._tab_index_tools = self.tab_widget.indexOf(self.tools_tab)
@@ -134,7 +136,7 @@ class MainWindow(QMainWindow):
             if icon_path.exists():
                 self.setWindowIcon(QIcon(str(icon_path)))
         except Exception as e:
-            logger.warning(f"Could not set window icon: {e}")
+            logger.warning("Could not set window icon: %s", e)
 
     def _check_dependencies(self) -> None:
         missing = []
@@ -157,7 +159,7 @@ class MainWindow(QMainWindow):
         elif not config.get_mkvinfo_path():
             config.set_mkvinfo_path(path)
         if missing:
-            logger.warning(f"Missing dependencies: {', '.join(missing)}")
+            logger.warning("Missing dependencies: %s", ", ".join(missing))
 
     def _get_files(self):
         return self.files_tab.get_files()
@@ -195,7 +197,10 @@ class MainWindow(QMainWindow):
         elif index == self._tab_index_settings:
             self.settings_tab.reload_from_config()
         elif index == self._tab_index_ffmpeg:
+            self.ffmpeg_tab.reload_from_config()
             self.ffmpeg_tab.apply_audio_normalize_settings_from_config()
+        elif index == self._tab_index_handbrake:
+            self.handbrake_tab.reload_from_config()
         elif index == self._tab_index_tools:
             self.tools_tab.refresh_loudnorm_from_config()
         elif index == self._tab_index_debug:
@@ -220,7 +225,7 @@ class MainWindow(QMainWindow):
             if hasattr(self.tools_tab, "_init_encoder"):
                 self.tools_tab._init_encoder()
         except Exception as e:
-            logger.warning(f"Could not refresh encoder clients: {e}")
+            logger.warning("Could not refresh encoder clients: %s", e)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         try:
@@ -230,7 +235,7 @@ class MainWindow(QMainWindow):
                     logger.info("Stopping FFmpeg encoder on window close")
                     enc.stop()
         except Exception as e:
-            logger.warning(f"Error stopping FFmpeg encoder: {e}")
+            logger.warning("Error stopping FFmpeg encoder: %s", e)
         try:
             if self.handbrake_tab and getattr(self.handbrake_tab, "is_encoding", False):
                 enc = getattr(self.handbrake_tab, "encoder", None)
@@ -238,12 +243,12 @@ class MainWindow(QMainWindow):
                     logger.info("Stopping HandBrake encoder on window close")
                     enc.stop()
         except Exception as e:
-            logger.warning(f"Error stopping HandBrake encoder: {e}")
+            logger.warning("Error stopping HandBrake encoder: %s", e)
         try:
             if getattr(self, "tools_tab", None):
                 self.tools_tab.shutdown_tools()
         except Exception as e:
-            logger.warning(f"Error stopping Tools batch: {e}")
+            logger.warning("Error stopping Tools batch: %s", e)
         # Join encoding threads before tearing down the DB engine
         try:
             ffmpeg_thread = getattr(self.ffmpeg_tab, "encoding_thread", None)
@@ -251,17 +256,29 @@ class MainWindow(QMainWindow):
                 logger.info("Waiting for FFmpeg encoding thread to finish...")
                 ffmpeg_thread.join(timeout=10.0)
         except Exception as e:
-            logger.warning(f"Error joining FFmpeg encoding thread: {e}")
+            logger.warning("Error joining FFmpeg encoding thread: %s", e)
         try:
             hb_thread = getattr(self.handbrake_tab, "encoding_thread", None)
             if hb_thread and hb_thread.is_alive():
                 logger.info("Waiting for HandBrake encoding thread to finish...")
                 hb_thread.join(timeout=10.0)
         except Exception as e:
-            logger.warning(f"Error joining HandBrake encoding thread: {e}")
+            logger.warning("Error joining HandBrake encoding thread: %s", e)
+        try:
+            if self.ffmpeg_tab:
+                self.ffmpeg_tab.shutdown()
+        except Exception as e:
+            logger.warning("Error shutting down FFmpeg prefetch pool: %s", e)
+        try:
+            if self.handbrake_tab:
+                self.handbrake_tab.shutdown()
+        except Exception as e:
+            logger.warning("Error shutting down HandBrake analysis pool: %s", e)
+        self.settings_tab.flush_pending_edits()
         config.flush()
+        track_cache.flush()
         try:
             dispose_engine()
         except Exception as e:
-            logger.warning(f"Error closing stats database: {e}")
+            logger.warning("Error closing stats database: %s", e)
         event.accept()
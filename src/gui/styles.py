@@ -181,6 +181,10 @@ def get_stylesheet() -> str:
     QLabel {{
         color: {T.APP_TEXT};
     }}
+    QLabel[role="note"] {{
+        color: {T.APP_TEXT_DIM};
+        font-size: 12px;
+    }}
     QGroupBox {{
         border: 1px solid {T.APP_BORDER};
         margin-top: 12px;
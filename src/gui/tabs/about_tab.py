@@ -100,7 +100,7 @@ class AboutTab(QWidget):
         h.addStretch()
         ref_l.addLayout(h)
         self._about_status = QLabel("")
-        self._about_status.setStyleSheet("color: #888888; font-size: 12px;")
+        self._about_status.setProperty("role", "note")
         ref_l.addWidget(self._about_status)
         v.addWidget(ref_row)
         v.addStretch()
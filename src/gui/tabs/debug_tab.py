@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import os
+import queue
+import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -27,18 +31,39 @@ from core.track_analyzer import TrackAnalyzer
 from utils.config import config
 from utils.logger import logger
 
+# mkvinfo output is fed into the view in chunks so huge files do not freeze
+# the UI; the view keeps at most this many lines (oldest dropped).
+_MKVINFO_CHUNK_CHARS = 4096
+# A partial chunk is still queued once it has waited this long (slow mkvinfo output).
+_MKVINFO_CHUNK_MAX_AGE_SEC = 0.05
+_MKVINFO_DRAIN_INTERVAL_MS = 50
+_MKVINFO_DRAIN_MAX_CHUNKS = 16
+_MKVINFO_VIEW_MAX_LINES = 10_000
+
+
+class _MkvinfoStreamStopped(Exception):
+    """Raised from the output callback to stop a superseded mkvinfo run."""
+
 
 class DebugTab(QWidget):
+    # Directory of the last video picked via "Browse" (shared across instances).
+    _last_video_dir: Optional[str] = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
-        self.track_analyzer = TrackAnalyzer(
-            mkvinfo_path=mkvinfo_path if mkvinfo_path != "mkvinfo" else None
-        )
+        self.track_analyzer: Optional[TrackAnalyzer] = None
+        # mkvinfo path behind track_analyzer; an unchanged path keeps its output cache.
+        self._mkvinfo_path: Optional[str] = None
+        self.reload_from_config()
         self.current_file: Optional[Path] = None
         self._debug_tab_index = -1
         self._main_tab_current = -1
         self._follow_timer: Optional[QTimer] = None
+        self._mkvinfo_queue: "queue.Queue[object]" = queue.Queue()
+        self._mkvinfo_stop = threading.Event()
+        self._mkvinfo_timer = QTimer(self)
+        self._mkvinfo_timer.setInterval(_MKVINFO_DRAIN_INTERVAL_MS)
+        self._mkvinfo_timer.timeout.connect(self._drain_mkvinfo_queue)
 
         root = QVBoxLayout(self)
         top = QHBoxLayout()
@@ -52,6 +77,7 @@ class DebugTab(QWidget):
         tabs = QTabWidget()
         self.mkvinfo_text = QPlainTextEdit()
         self.mkvinfo_text.setReadOnly(True)
+        self.mkvinfo_text.setMaximumBlockCount(_MKVINFO_VIEW_MAX_LINES)
         miw = QWidget()
         mil = QVBoxLayout(miw)
         mil.addWidget(self._btn_row(("Copy", lambda: self._copy(self.mkvinfo_text)), ("Clear", lambda: self._clear_view(self.mkvinfo_text))))
@@ -143,11 +169,17 @@ class DebugTab(QWidget):
         self._scroll_plain_to_end(self.log_display)
 
     def reload_from_config(self) -> None:
-        """Recreate track analyzer after mkvinfo path changes in Settings."""
+        """Refresh cached config values after Settings changes, recreating the
+        track analyzer only when the mkvinfo path changed."""
         m = config.get_mkvinfo_path() or "mkvinfo"
-        self.track_analyzer = TrackAnalyzer(
-            mkvinfo_path=m if m != "mkvinfo" else None
-        )
+        if self.track_analyzer is None or m != self._mkvinfo_path:
+            self.track_analyzer = TrackAnalyzer(
+                mkvinfo_path=m if m != "mkvinfo" else None
+            )
+            self._mkvinfo_path = m
+        self._mediainfo_path = config.get_mediainfo_path()
+        self._audio_language_tags = config.get_audio_language_tags()
+        self._subtitle_name_patterns = config.get_subtitle_name_patterns()
 
     def _btn(self, t, fn):
         b = QPushButton(t)
@@ -178,20 +210,23 @@ class DebugTab(QWidget):
 
     def _browse(self) -> None:
         p, _ = QFileDialog.getOpenFileName(
-            self, "Video", "", "Video (*.mkv *.mp4 *.mov *.avi);;All (*.*)"
+            self,
+            "Video",
+            DebugTab._last_video_dir or str(Path.home()),
+            "Video (*.mkv *.mp4 *.mov *.avi);;All (*.*)",
         )
         if p:
             self.current_file = Path(p)
+            DebugTab._last_video_dir = str(self.current_file.parent)
             self.file_label.setText(self.current_file.name)
 
     def _analyze(self) -> None:
         if not self.current_file:
             return
-        out = self.track_analyzer.get_mkvinfo_output(self.current_file)
-        self.mkvinfo_text.setPlainText(out or "Failed to get mkvinfo output.")
-        self._scroll_plain_to_end(self.mkvinfo_text)
-        tracks = self.track_analyzer.analyze_tracks(self.current_file)
-        lines = [f"File: {self.current_file.name}", ""]
+        self._start_mkvinfo_stream(self.current_file)
+
+    def _show_track_analysis(self, path: Path, tracks: dict) -> None:
+        lines = [f"File: {path.name}", ""]
         lines.append(f"Audio Track: {tracks.get('audio', 'Not found')}")
         sub = tracks.get("subtitle")
         lines.append(
@@ -208,21 +243,103 @@ class DebugTab(QWidget):
                     f"\nID {tr['id']} type={tr.get('type')} lang={tr.get('language')} name={tr.get('name')}"
                 )
         lines.append("\n" + "=" * 50 + "\nDetection settings:\n")
-        lines.append(f"Audio lang tags: {config.get_audio_language_tags()}")
-        lines.append(f"Subtitle name patterns: {config.get_subtitle_name_patterns()}")
+        lines.append(f"Audio lang tags: {self._audio_language_tags}")
+        lines.append(f"Subtitle name patterns: {self._subtitle_name_patterns}")
         self.analysis_text.setPlainText("\n".join(lines))
         self._scroll_plain_to_end(self.analysis_text)
 
+    def _start_mkvinfo_stream(self, path: Path) -> None:
+        """Analyze ``path`` on a background thread and stream the mkvinfo
+        output into the view in chunks."""
+        self._mkvinfo_stop.set()
+        self._mkvinfo_stop = threading.Event()
+        self._mkvinfo_queue = queue.Queue()
+        self.mkvinfo_text.clear()
+        self.analysis_text.setPlainText("Analyzing...")
+        threading.Thread(
+            target=self._stream_mkvinfo,
+            args=(self.track_analyzer, path, self._mkvinfo_queue, self._mkvinfo_stop),
+            daemon=True,
+        ).start()
+        self._mkvinfo_timer.start()
+
+    @staticmethod
+    def _stream_mkvinfo(
+        analyzer: TrackAnalyzer,
+        path: Path,
+        out: "queue.Queue[object]",
+        stop: threading.Event,
+    ) -> None:
+        """Queue items: ``str`` output chunks, one ``(path, tracks)`` tuple, then ``None``.
+
+        Lines are queued while mkvinfo is still running, batched by size or age.
+        """
+        buf: list[str] = []
+        size = 0
+        last_put = time.monotonic()
+
+        def put_buffered() -> None:
+            nonlocal size, last_put
+            if buf:
+                out.put("".join(buf))
+                buf.clear()
+            size = 0
+            last_put = time.monotonic()
+
+        def on_output(text: str) -> None:
+            nonlocal size
+            if stop.is_set():
+                raise _MkvinfoStreamStopped
+            buf.append(text)
+            size += len(text)
+            if size >= _MKVINFO_CHUNK_CHARS or time.monotonic() - last_put >= _MKVINFO_CHUNK_MAX_AGE_SEC:
+                put_buffered()
+
+        try:
+            raw, tracks = analyzer.analyze_with_output(path, on_output)
+            put_buffered()
+            if not raw:
+                out.put("Failed to get mkvinfo output.")
+            out.put((path, tracks))
+        except _MkvinfoStreamStopped:
+            pass
+        finally:
+            out.put(None)
+
+    def _drain_mkvinfo_queue(self) -> None:
+        chunks: list[str] = []
+        result: Optional[tuple] = None
+        done = False
+        for _ in range(_MKVINFO_DRAIN_MAX_CHUNKS):
+            try:
+                item = self._mkvinfo_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+                break
+            if isinstance(item, tuple):
+                result = item
+            else:
+                chunks.append(item)
+        if chunks:
+            text = "".join(chunks)
+            # appendPlainText starts a new line itself; drop only that one newline so blank lines survive.
+            self.mkvinfo_text.appendPlainText(text[:-1] if text.endswith("\n") else text)
+        if result is not None:
+            self._show_track_analysis(*result)
+        if done:
+            self._mkvinfo_timer.stop()
+            self._scroll_plain_to_end(self.mkvinfo_text)
+
     def _run_mediainfo(self) -> None:
         if not self.current_file or not self.current_file.exists():
             self.mi_out.setPlainText("Select a file and click Browse first.")
             return
-        mediainfo_path = config.get_mediainfo_path()
+        mediainfo_path = self._mediainfo_path
         if mediainfo_path and Path(mediainfo_path).exists():
             mediainfo_path = str(Path(mediainfo_path).resolve())
         else:
-            import shutil
-
             mediainfo_path = shutil.which("mediainfo") or shutil.which("mediainfo.exe")
         if not mediainfo_path:
             self.mi_out.setPlainText("Set MediaInfo path in Settings or install on PATH.")
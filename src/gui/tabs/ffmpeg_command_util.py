@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import html
 import re
 import shlex
 import tempfile
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from core.ffmpeg_translator import _escape_ffmpeg_filter_path
 from utils.config import config
@@ -36,6 +37,65 @@ _PREVIEW_KNOWN_TOKENS = frozenset(
 
 _UNKNOWN_PLACEHOLDER_RE = re.compile(r"(\{[A-Z][A-Z0-9_]*\}|<[A-Z][A-Z0-9_]*>)")
 
+# Template substitution patterns, compiled once and shared by the preview and
+# the per-file command builder.
+_SCALE_SI_RE = re.compile(r"(scale=[^,\s'\"]+):si=\d+")
+# Example names accepted in place of {INPUT}/{OUTPUT}. Matching these casings
+# literally avoids running the whole template through IGNORECASE case folding.
+_INPUT_EXAMPLE_NAMES = ("input.mkv", "Input.mkv", "INPUT.MKV")
+_OUTPUT_EXAMPLE_NAMES = ("output.mp4", "Output.mp4", "OUTPUT.MP4")
+_INPUT_EXAMPLE_ALT = "|".join(re.escape(n) for n in _INPUT_EXAMPLE_NAMES)
+_OUTPUT_EXAMPLE_ALT = "|".join(re.escape(n) for n in _OUTPUT_EXAMPLE_NAMES)
+_INPUT_MKV_RE = re.compile(rf"\b(?:{_INPUT_EXAMPLE_ALT})\b")
+_OUTPUT_MP4_RE = re.compile(rf"\b(?:{_OUTPUT_EXAMPLE_ALT})\b")
+_AUDIO_A_RE = re.compile(r"0:[aA]:\s*(?:\d+\\)?[{<]AUDIO_TRACK[}>]")
+_MAP_AUDIO_AFTER_VIDEO_RE = re.compile(
+    r"(-map\s+0:v:0\s+)-map\s+0:(?:\d+|\{AUDIO_TRACK\}|<AUDIO_TRACK>)"
+)
+_SUBTITLE_FILTER_AFTER_RE = re.compile(
+    r",\s*subtitles=['\"](?:\{SUBTITLE_FILE\}|<SUBTITLE_FILE>)['\"]"
+)
+_SUBTITLE_FILTER_BEFORE_RE = re.compile(
+    r"subtitles=['\"](?:\{SUBTITLE_FILE\}|<SUBTITLE_FILE>)['\"]\s*,"
+)
+# Every placeholder parse_and_substitute_command resolves, in one alternation so
+# the template is scanned once. ``audio_a`` (``0:a:{AUDIO_TRACK}``) is listed
+# first because it takes the 0-based audio index rather than the track number.
+_PLACEHOLDER_RE = re.compile(
+    r"(?P<audio_a>0:[aA]:\s*(?:\d+\\)?(?:\{AUDIO_TRACK\}|<AUDIO_TRACK>))|"
+    rf"\b(?:{_INPUT_EXAMPLE_ALT}|{_OUTPUT_EXAMPLE_ALT})\b|\{{INPUT\}}|<INPUT>|\{{OUTPUT\}}|<OUTPUT>|"
+    r"\{AUDIO_TRACK\}|<AUDIO_TRACK>|\{SUBTITLE_TRACK\}|<SUBTITLE_TRACK>|"
+    r"\{SUBTITLE_FILE\}|<SUBTITLE_FILE>"
+)
+_REMAINING_PLACEHOLDER_RE = re.compile(r"\{[A-Z_]+\}|<[A-Z_]+>")
+# Placeholders that parse_and_substitute_command resolves when they form a whole token.
+_WHOLE_TOKEN_PLACEHOLDERS = frozenset(
+    {
+        *_INPUT_EXAMPLE_NAMES,
+        "{INPUT}",
+        "<INPUT>",
+        *_OUTPUT_EXAMPLE_NAMES,
+        "{OUTPUT}",
+        "<OUTPUT>",
+        "{AUDIO_TRACK}",
+        "<AUDIO_TRACK>",
+        "{SUBTITLE_TRACK}",
+        "<SUBTITLE_TRACK>",
+        "{SUBTITLE_FILE}",
+        "<SUBTITLE_FILE>",
+    }
+)
+_AUDIO_A_TOKEN_RE = re.compile(r"0:a:(?:\d+\\)?(?:\{AUDIO_TRACK\}|<AUDIO_TRACK>)", re.IGNORECASE)
+# ``0:a: {AUDIO_TRACK}`` (space after the colon, accepted by _AUDIO_A_RE) splits into two tokens.
+_AUDIO_A_PREFIX_TOKEN_RE = re.compile(r"0:a:", re.IGNORECASE)
+_AUDIO_TRACK_TAIL_TOKEN_RE = re.compile(r"(?:\d+\\)?(?:\{AUDIO_TRACK\}|<AUDIO_TRACK>)", re.IGNORECASE)
+_MAP_AUDIO_TOKEN_RE = re.compile(r"0:(?:\d+|\{AUDIO_TRACK\}|<AUDIO_TRACK>)")
+_FFMPEG_WORD_RE = re.compile(r"\bffmpeg\b", re.IGNORECASE)
+# Same split as shlex.split(posix=False) with outer double quotes removed: a token
+# that opens with a quote ends at its closing quote, anything else runs to the next
+# whitespace. A lone quote (no closing partner) matches the last branch.
+_TEMPLATE_TOKEN_RE = re.compile(r'"([^"]*)"|\'[^\']*\'|[^ \t\r\n"\'][^ \t\r\n]*|["\']')
+
 
 def _global_map_stream_index(audio_track: int, audio_ffmpeg_stream_index: Optional[int]) -> int:
     """0-based FFmpeg stream index for -map 0:N after -map 0:v:0 (Matroska id when known)."""
@@ -48,6 +108,8 @@ def _global_map_stream_index(audio_track: int, audio_ffmpeg_stream_index: Option
 # Characters that require a path to be double-quoted when embedded in a
 # command string that will later be parsed by shlex.split().
 _PATH_QUOTE_CHARS = frozenset(' &^%!')
+# Preview-only subtitle path escaping (slashes, \: and shell-style '\'') in one pass.
+_PREVIEW_SUB_PATH_TRANS = str.maketrans({"\\": "/", ":": "\\:", "'": "'\\''"})
 
 
 def _strip_windows_shlex_outer_quotes(token: str) -> str:
@@ -57,6 +119,93 @@ def _strip_windows_shlex_outer_quotes(token: str) -> str:
     return token
 
 
+def _split_template(template: str) -> List[str]:
+    """Split a command like shlex.split(posix=False) plus outer-quote stripping, using one regex scan.
+
+    Falls back to shlex when a quote is left open so its ValueError still reports the problem.
+    """
+    tokens: List[str] = []
+    for m in _TEMPLATE_TOKEN_RE.finditer(template):
+        token = m.group(0)
+        if token == '"' or token == "'":
+            return [_strip_windows_shlex_outer_quotes(t) for t in shlex.split(template, posix=False)]
+        inner = m.group(1)
+        tokens.append(token if inner is None else inner)
+    return tokens
+
+
+@functools.lru_cache(maxsize=4)
+def _allowed_ffmpeg_names(ffmpeg_executable: str) -> frozenset:
+    """Lowercased executable names accepted as the first argument for a configured FFmpeg path."""
+    configured_name = Path(ffmpeg_executable).name.lower()
+    if configured_name:
+        return frozenset(("ffmpeg", "ffmpeg.exe", configured_name))
+    return frozenset(("ffmpeg", "ffmpeg.exe"))
+
+
+@functools.lru_cache(maxsize=16)
+def _tokenize_template(command_template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Split a template into (token, kind) pairs once so a batch only substitutes per file.
+
+    kind is None for literal tokens, "PLACEHOLDER" when the token is exactly one
+    placeholder, "AUDIO_A" for ``0:a:{AUDIO_TRACK}``, "MAP_AUDIO" for the stream after
+    ``-map 0:v:0 -map`` (token holds any trailing text), or "EMBEDDED" when
+    placeholders sit inside a larger token such as a subtitles= filter.
+    Returns None when the template cannot be split.
+    """
+    template = _SCALE_SI_RE.sub(r"\1", command_template)
+    try:
+        tokens = _split_template(template)
+    except ValueError:
+        return None
+    return _classify_tokens(tuple(tokens))
+
+
+@functools.lru_cache(maxsize=16)
+def _tokenize_argv_template(argv_template: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Same as _tokenize_template for a template that is already an argv list."""
+    return _classify_tokens(tuple(_SCALE_SI_RE.sub(r"\1", t) for t in argv_template))
+
+
+def _join_split_audio_a(tokens: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Rejoin a ``0:a:`` token with a following lone audio placeholder into one ``0:a:{AUDIO_TRACK}`` token."""
+    joined: List[str] = []
+    k = 0
+    while k < len(tokens):
+        token = tokens[k]
+        if (
+            k + 1 < len(tokens)
+            and _AUDIO_A_PREFIX_TOKEN_RE.fullmatch(token)
+            and _AUDIO_TRACK_TAIL_TOKEN_RE.fullmatch(tokens[k + 1])
+        ):
+            joined.append(token + tokens[k + 1])
+            k += 2
+        else:
+            joined.append(token)
+            k += 1
+    return tuple(joined)
+
+
+def _classify_tokens(tokens: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    tokens = _join_split_audio_a(tokens)
+    tagged: List[Tuple[str, Optional[str]]] = []
+    for k, token in enumerate(tokens):
+        map_match = None
+        if tokens[k - 3:k] == ("-map", "0:v:0", "-map"):
+            map_match = _MAP_AUDIO_TOKEN_RE.match(token)
+        if map_match:
+            tagged.append((token[map_match.end():], "MAP_AUDIO"))
+        elif _AUDIO_A_TOKEN_RE.fullmatch(token):
+            tagged.append((token, "AUDIO_A"))
+        elif token in _WHOLE_TOKEN_PLACEHOLDERS:
+            tagged.append((token, "PLACEHOLDER"))
+        elif _PLACEHOLDER_RE.search(token):
+            tagged.append((token, "EMBEDDED"))
+        else:
+            tagged.append((token, None))
+    return tuple(tagged)
+
+
 def _escape_gap_with_placeholder_marks(gap_plain: str) -> str:
     """HTML-escape a gap between primary tokens; badge unknown {FOO}/<FOO> placeholders."""
     if not gap_plain:
@@ -174,65 +323,49 @@ def generate_command_preview(
     input_file_quoted = quote_path_if_needed(input_file_str)
     output_file_quoted = quote_path_if_needed(output_file_str)
 
-    def escape_for_replacement(path_str: str) -> str:
-        return path_str.replace("\\", "\\\\")
-
-    command = re.sub(r"\binput\.mkv\b", lambda m: input_file_quoted, command, flags=re.IGNORECASE)
-    command = re.sub(r"\{INPUT\}", lambda m: input_file_quoted, command)
-    command = re.sub(r"<INPUT>", lambda m: input_file_quoted, command)
-    command = re.sub(r"\boutput\.mp4\b", lambda m: output_file_quoted, command, flags=re.IGNORECASE)
-    command = re.sub(r"\{OUTPUT\}", lambda m: output_file_quoted, command)
-    command = re.sub(r"<OUTPUT>", lambda m: output_file_quoted, command)
-    audio_0based_for_a = max(0, audio_track - 1)
-    command = re.sub(
-        r"0:a:\s*\{AUDIO_TRACK\}",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*<AUDIO_TRACK>",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*\d+\\\{AUDIO_TRACK\}",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*\d+\\<AUDIO_TRACK>",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(r"\{AUDIO_TRACK\}", str(audio_track), command)
-    command = re.sub(r"<AUDIO_TRACK>", str(audio_track), command)
-    audio_stream_id = _global_map_stream_index(audio_track, stream_idx)
-    command = re.sub(
-        r"(-map\s+0:v:0\s+)-map\s+0:\d+",
-        rf"\1-map 0:{audio_stream_id}",
-        command,
-    )
-    if subtitle_track is not None:
-        command = re.sub(r"\{SUBTITLE_TRACK\}", str(subtitle_track), command)
-        command = re.sub(r"<SUBTITLE_TRACK>", str(subtitle_track), command)
-    if subtitle_file:
-        sub_path = str(subtitle_file).replace("\\", "/").replace(":", "\\:")
-        sub_path = sub_path.replace("'", "'\\''")
-        command = re.sub(r"\{SUBTITLE_FILE\}", lambda m: sub_path, command)
-        command = re.sub(r"<SUBTITLE_FILE>", lambda m: sub_path, command)
-    command = re.sub(r'"input\.mkv"', lambda m: input_file_quoted, command, flags=re.IGNORECASE)
-    command = re.sub(r'"output\.mp4"', lambda m: output_file_quoted, command, flags=re.IGNORECASE)
-    input_single_quoted = f"'{input_file_str}'"
-    output_single_quoted = f"'{output_file_str}'"
-    command = re.sub(r"'input\.mkv'", lambda m: input_single_quoted, command, flags=re.IGNORECASE)
-    command = re.sub(r"'output\.mp4'", lambda m: output_single_quoted, command, flags=re.IGNORECASE)
+    # Literal placeholders use str.replace; regex is kept only where the
+    # pattern needs it (word boundaries, 0:a: indices, the -map rewrite).
+    # Each pass is skipped when a substring check shows it cannot match.
+    # The example names are case-sensitive literals, so plain ``in`` checks on
+    # the template suffice (no lowered copy of the command).
+    has_input_example = any(name in command for name in _INPUT_EXAMPLE_NAMES)
+    has_output_example = any(name in command for name in _OUTPUT_EXAMPLE_NAMES)
+    if has_input_example:
+        command = _INPUT_MKV_RE.sub(lambda m: input_file_quoted, command)
+    if "INPUT" in command:
+        command = command.replace("{INPUT}", input_file_quoted).replace("<INPUT>", input_file_quoted)
+    if has_output_example:
+        command = _OUTPUT_MP4_RE.sub(lambda m: output_file_quoted, command)
+    if "OUTPUT" in command:
+        command = command.replace("{OUTPUT}", output_file_quoted).replace("<OUTPUT>", output_file_quoted)
+    if "AUDIO_TRACK" in command:
+        audio_a = f"0:a:{max(0, audio_track - 1)}"
+        audio_track_str = str(audio_track)
+        command = _AUDIO_A_RE.sub(audio_a, command)
+        command = command.replace("{AUDIO_TRACK}", audio_track_str).replace("<AUDIO_TRACK>", audio_track_str)
+    if "0:v:0" in command:
+        audio_stream_id = _global_map_stream_index(audio_track, stream_idx)
+        command = _MAP_AUDIO_AFTER_VIDEO_RE.sub(rf"\1-map 0:{audio_stream_id}", command)
+    if subtitle_track is not None and "SUBTITLE_TRACK" in command:
+        subtitle_track_str = str(subtitle_track)
+        command = command.replace("{SUBTITLE_TRACK}", subtitle_track_str)
+        command = command.replace("<SUBTITLE_TRACK>", subtitle_track_str)
+    if subtitle_file and "SUBTITLE_FILE" in command:
+        sub_path = str(subtitle_file).translate(_PREVIEW_SUB_PATH_TRANS)
+        command = command.replace("{SUBTITLE_FILE}", sub_path).replace("<SUBTITLE_FILE>", sub_path)
+    if has_input_example:
+        input_single_quoted = f"'{input_file_str}'"
+        for name in _INPUT_EXAMPLE_NAMES:
+            command = command.replace(f'"{name}"', input_file_quoted)
+            command = command.replace(f"'{name}'", input_single_quoted)
+    if has_output_example:
+        output_single_quoted = f"'{output_file_str}'"
+        for name in _OUTPUT_EXAMPLE_NAMES:
+            command = command.replace(f'"{name}"', output_file_quoted)
+            command = command.replace(f"'{name}'", output_single_quoted)
     ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
     if ffmpeg_path != "ffmpeg":
-        command = re.sub(r"\bffmpeg\b", lambda m: ffmpeg_path, command, flags=re.IGNORECASE)
+        command = _FFMPEG_WORD_RE.sub(lambda m: ffmpeg_path, command)
     return command
 
 
@@ -245,92 +378,76 @@ def parse_and_substitute_command(
     subtitle_file: Optional[Path],
     on_log: Callable[[str, str], None],
     audio_ffmpeg_stream_index: Optional[int] = None,
+    ffmpeg_path: Optional[str] = None,
+    argv_template: Optional[Sequence[str]] = None,
 ) -> List[str]:
-    command = command_template
-    command = re.sub(r"(scale=[^,\s'\"]+):si=\d+", r"\1", command)
+    """Build the FFmpeg argv for one file from ``command_template``.
 
-    def escape_for_replacement(path_str: str) -> str:
-        return path_str.replace("\\", "\\\\")
-
-    def quote_path_if_needed(path_str: str) -> str:
-        # Quote paths with spaces or special characters
-        if any(c in path_str for c in _PATH_QUOTE_CHARS):
-            return f'"{path_str}"'
-        return path_str
+    ``ffmpeg_path`` is the configured executable; batch callers pass the value
+    they snapshotted so config is not read once per file. ``argv_template`` is
+    the same template as an argv list (e.g. straight from the preset translator);
+    when given, the string is not split at all.
+    """
+    if argv_template is not None:
+        tokens = _tokenize_argv_template(tuple(argv_template))
+    else:
+        tokens = _tokenize_template(command_template)
+    if tokens is None:
+        on_log("ERROR", "Command parsing failed (unbalanced quotes); cannot build argument list.")
+        return []
 
+    # Values go straight into argv entries, so paths need no shell quoting or
+    # regex-template escaping.
+    audio_track_str = str(audio_track)
+    audio_a = f"0:a:{max(0, audio_track - 1)}"
+    map_audio = f"0:{_global_map_stream_index(audio_track, audio_ffmpeg_stream_index)}"
     input_file_str = str(input_file)
     output_file_str = str(output_file)
-    input_file_quoted = quote_path_if_needed(input_file_str)
-    output_file_quoted = quote_path_if_needed(output_file_str)
-    input_file_escaped = escape_for_replacement(input_file_quoted)
-    output_file_escaped = escape_for_replacement(output_file_quoted)
-
-    command = re.sub(r"\binput\.mkv\b", input_file_escaped, command, flags=re.IGNORECASE)
-    command = re.sub(r"\{INPUT\}", input_file_escaped, command)
-    command = re.sub(r"<INPUT>", input_file_escaped, command)
-    command = re.sub(r"\boutput\.mp4\b", output_file_escaped, command, flags=re.IGNORECASE)
-    command = re.sub(r"\{OUTPUT\}", output_file_escaped, command)
-    command = re.sub(r"<OUTPUT>", output_file_escaped, command)
-    audio_0based_for_a = max(0, audio_track - 1)
-    command = re.sub(
-        r"0:a:\s*\{AUDIO_TRACK\}",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*<AUDIO_TRACK>",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*\d+\\\{AUDIO_TRACK\}",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(
-        r"0:a:\s*\d+\\<AUDIO_TRACK>",
-        f"0:a:{audio_0based_for_a}",
-        command,
-        flags=re.IGNORECASE,
-    )
-    command = re.sub(r"\{AUDIO_TRACK\}", str(audio_track), command)
-    command = re.sub(r"<AUDIO_TRACK>", str(audio_track), command)
-    audio_stream_id = _global_map_stream_index(audio_track, audio_ffmpeg_stream_index)
-    command = re.sub(
-        r"(-map\s+0:v:0\s+)-map\s+0:\d+",
-        rf"\1-map 0:{audio_stream_id}",
-        command,
-    )
+    replacements = {
+        "{INPUT}": input_file_str,
+        "<INPUT>": input_file_str,
+        "{OUTPUT}": output_file_str,
+        "<OUTPUT>": output_file_str,
+        "{AUDIO_TRACK}": audio_track_str,
+        "<AUDIO_TRACK>": audio_track_str,
+    }
+    replacements.update(dict.fromkeys(_INPUT_EXAMPLE_NAMES, input_file_str))
+    replacements.update(dict.fromkeys(_OUTPUT_EXAMPLE_NAMES, output_file_str))
     if subtitle_track is not None:
-        command = re.sub(r"\{SUBTITLE_TRACK\}", str(subtitle_track), command)
-        command = re.sub(r"<SUBTITLE_TRACK>", str(subtitle_track), command)
+        replacements["{SUBTITLE_TRACK}"] = replacements["<SUBTITLE_TRACK>"] = str(subtitle_track)
     if subtitle_file:
         sub_path = _escape_ffmpeg_filter_path(str(subtitle_file))
-        command = re.sub(r"\{SUBTITLE_FILE\}", lambda m: sub_path, command)
-        command = re.sub(r"<SUBTITLE_FILE>", lambda m: sub_path, command)
-    else:
-        command = re.sub(
-            r",\s*subtitles=['\"](?:\{SUBTITLE_FILE\}|<SUBTITLE_FILE>)['\"]",
-            "",
-            command,
-        )
-        command = re.sub(
-            r"subtitles=['\"](?:\{SUBTITLE_FILE\}|<SUBTITLE_FILE>)['\"]\s*,",
-            "",
-            command,
-        )
-    if "input.mkv" in command.lower() or "output.mp4" in command.lower():
-        command = re.sub(r'"input\.mkv"', input_file_escaped, command, flags=re.IGNORECASE)
-        command = re.sub(r'"output\.mp4"', output_file_escaped, command, flags=re.IGNORECASE)
-        input_single_quoted = escape_for_replacement(f"'{input_file_str}'")
-        output_single_quoted = escape_for_replacement(f"'{output_file_str}'")
-        command = re.sub(r"'input\.mkv'", input_single_quoted, command, flags=re.IGNORECASE)
-        command = re.sub(r"'output\.mp4'", output_single_quoted, command, flags=re.IGNORECASE)
-
-    _remaining = re.findall(r"\{[A-Z_]+\}|<[A-Z_]+>", command)
+        replacements["{SUBTITLE_FILE}"] = replacements["<SUBTITLE_FILE>"] = sub_path
+
+    def substitute(match: re.Match) -> str:
+        if match.group("audio_a") is not None:
+            return audio_a
+        token = match.group(0)
+        return replacements.get(token, token)
+
+    args: List[str] = []
+    _remaining: List[str] = []
+    for token, kind in tokens:
+        if kind == "PLACEHOLDER":
+            value = replacements.get(token)
+            if value is not None:
+                args.append(value)
+                continue
+            arg = token
+        elif kind == "AUDIO_A":
+            arg = audio_a
+        elif kind == "MAP_AUDIO":
+            arg = map_audio + _PLACEHOLDER_RE.sub(substitute, token)
+        elif kind == "EMBEDDED":
+            arg = _PLACEHOLDER_RE.sub(substitute, token)
+            if not subtitle_file:
+                arg = _SUBTITLE_FILTER_AFTER_RE.sub("", arg)
+                arg = _SUBTITLE_FILTER_BEFORE_RE.sub("", arg)
+        else:
+            arg = token
+        _remaining.extend(_REMAINING_PLACEHOLDER_RE.findall(arg))
+        args.append(arg)
+
     if _remaining:
         on_log(
             "WARNING",
@@ -338,30 +455,19 @@ def parse_and_substitute_command(
             + ", ".join(dict.fromkeys(_remaining)),
         )
 
-    # Validate input/output files exist before parsing command
+    # Validate input/output files exist before building the command
     # (use original unescaped paths, not the FFmpeg-escaped versions)
     if not input_file.exists():
         on_log("ERROR", f"Input file does not exist: {input_file}")
         return []
 
-    try:
-        args = shlex.split(command, posix=False)
-    except Exception as e:
-        on_log("ERROR", f"Command parsing failed ({e}); cannot build argument list.")
-        return []
-
-    args = [_strip_windows_shlex_outer_quotes(a) for a in args]
-
     if not args:
         return []
 
-    ffmpeg_executable = (config.get_ffmpeg_path() or "").strip() or "ffmpeg"
-    first_name = Path(args[0]).name.lower()
-    configured_name = Path(ffmpeg_executable).name.lower()
-    allowed_first = {"ffmpeg", "ffmpeg.exe"}
-    if configured_name:
-        allowed_first.add(configured_name)
-    if first_name not in allowed_first:
+    if ffmpeg_path is None:
+        ffmpeg_path = config.get_ffmpeg_path()
+    ffmpeg_executable = (ffmpeg_path or "").strip() or "ffmpeg"
+    if Path(args[0]).name.lower() not in _allowed_ffmpeg_names(ffmpeg_executable):
         raise ValueError(
             "Command must start with ffmpeg or ffmpeg.exe, or the FFmpeg executable "
             "configured in Settings (first argument was not recognized as FFmpeg)."
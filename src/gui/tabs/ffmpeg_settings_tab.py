@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Optional, Dict
 
 from PyQt6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QFormLayout,
@@ -603,6 +604,5 @@ class FFmpegSettingsTab(QWidget):
 
     def _copy_command(self) -> None:
         """Copy command to clipboard."""
-        from PyQt6.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(self.command_text.toPlainText())
@@ -6,12 +6,14 @@ mid-encode pause/resume API in ``core.encoder`` to wire here.
 
 from __future__ import annotations
 
+import os
 import threading
 import re
-import shlex
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, QThread, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QGuiApplication
@@ -60,9 +62,39 @@ from utils.logger import logger
 
 
 
+# How long to wait for a prefetched subtitle extraction before falling back
+# to a synchronous one.
+_SUBTITLE_PREFETCH_TIMEOUT_SEC = 120.0
+
+_AUDIO_COPY_RE = re.compile(r"-(?:c|codec):a\s+copy\b")
+# Where a new -af is inserted when the command has none, in order of preference.
+_AF_INSERT_BEFORE_RES = (
+    re.compile(r"\s-c:a\b"),
+    re.compile(r"\s-map_chapters\b"),
+    re.compile(r"\s-y\b"),
+)
+# Subtitle burn filters removed by _remove_subtitle_filter_from_command, applied in order.
+_SUBTITLE_FILTER_OPTION_RES = (
+    re.compile(r'-vf\s+"[^"]*subtitles=[^"]*"'),
+    re.compile(r"-vf\s+'[^']*subtitles=[^']*'"),
+    re.compile(r"-vf\s+\S*subtitles=\S+\s+"),
+    re.compile(r'-filter_complex\s+"[^"]*subtitles=[^"]*"'),
+    re.compile(r"-filter_complex\s+'[^']*subtitles=[^']*'"),
+)
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+
+def _is_empty_file(path: Path) -> bool:
+    """True when ``path`` exists with size 0 (one stat call; missing counts as not empty)."""
+    try:
+        return path.stat().st_size == 0
+    except OSError:
+        return False
+
+
 class _FFmpegUiBridge(QObject):
     log_msg = pyqtSignal(str, str)
-    progress = pyqtSignal(object)
+    progress_ready = pyqtSignal()
     reset_ui = pyqtSignal()
     toast = pyqtSignal(str, str)
     status_text = pyqtSignal(str)
@@ -70,6 +102,8 @@ class _FFmpegUiBridge(QObject):
 
 
 class FFmpegTab(QWidget):
+    # Directory of the last preset picked via "Load Preset" (shared across instances).
+    _last_preset_dir: Optional[str] = None
     _PLACEHOLDER_CHIP_STYLES = {
         "{INPUT}": ("#1e3a52", "#7dd3fc", "#2a4a6a"),
         "{OUTPUT}": ("#1a3d2e", "#4ade80", "#255238"),
@@ -77,26 +111,55 @@ class FFmpegTab(QWidget):
         "{SUBTITLE_TRACK}": ("#2d2640", "#c4b5fd", "#3d3558"),
         "{SUBTITLE_FILE}": ("#3d1f40", "#f9a8d4", "#522840"),
     }
+    # Stylesheet for all placeholder chips, built on first use and shared by every tab instance.
+    _placeholder_chips_css: Optional[str] = None
+    _X264_PRESETS = (
+        "ultrafast",
+        "superfast",
+        "veryfast",
+        "faster",
+        "fast",
+        "medium",
+        "slow",
+        "slower",
+        "veryslow",
+    )
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = None
         self.preset_parser: Optional[PresetParser] = None
         self.ffmpeg_translator: Optional[FFmpegTranslator] = None
+        # Name of the preset behind ffmpeg_translator; lets programmatic combo changes skip a reload.
+        self._current_preset_name: Optional[str] = None
         self.encoder: Optional[Encoder] = None
         self.track_analyzer: Optional[TrackAnalyzer] = None
         self.encoding_thread: Optional[threading.Thread] = None
         self._detect_thread: Optional[QThread] = None
         self._is_encoding = threading.Event()
+        # Extracts the next file's subtitle stream while the current file encodes.
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="encode-prefetch")
         self.batch_stats: Optional[BatchStats] = None
         self.get_files_callback: Optional[Callable] = None
         self.update_file_callback: Optional[Callable] = None
         self.get_output_path_callback: Optional[Callable] = None
-        self._progress_ui_throttle_last: Optional[float] = None
+        # Newest progress from the encode thread; ProgressDisplay limits the repaint rate.
+        self._progress_lock = threading.Lock()
+        self._progress_pending: Optional[EncodingProgress] = None
         self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
         self._preview_timer.timeout.connect(self._update_command_preview_display)
         self._last_preview_plain = ""
+        # Regenerating the command from the preset is debounced so bursts of
+        # preset loads only run the translator once.
+        self._cmd_regen_timer = QTimer(self)
+        self._cmd_regen_timer.setSingleShot(True)
+        self._cmd_regen_timer.timeout.connect(self._do_update_command_preview)
+        self._pending_conflict_check: Optional[Tuple[str, Path]] = None
+        # Last translator output as (command text, argv); lets a batch skip re-splitting
+        # the text when the user has not edited it.
+        self._generated_command: Optional[Tuple[str, Tuple[str, ...]]] = None
+        self._reload_config()
 
         self._bridge = _FFmpegUiBridge(self)
 
@@ -139,6 +202,8 @@ class FFmpegTab(QWidget):
         self.cmd_text = QPlainTextEdit()
         self.cmd_text.setMinimumHeight(90)
         self.cmd_text.textChanged.connect(self._schedule_preview_update)
+        # Any direct edit or load wins over a pending preset regeneration.
+        self.cmd_text.textChanged.connect(self._cmd_regen_timer.stop)
         cmd_l.addWidget(self.cmd_text)
         hb = QHBoxLayout()
         for t, fn in [
@@ -158,7 +223,7 @@ class FFmpegTab(QWidget):
             "the same way as Settings → Encoding."
         )
         loud_note.setWordWrap(True)
-        loud_note.setStyleSheet("color: #888888; font-size: 12px;")
+        loud_note.setProperty("role", "note")
         loud_l = QVBoxLayout(loud_gb)
         loud_l.addWidget(loud_note)
         loud_form = QFormLayout()
@@ -220,15 +285,10 @@ class FFmpegTab(QWidget):
         root.addWidget(preview_gb)
 
         ph_gb = QGroupBox("Insert placeholders")
+        ph_gb.setStyleSheet(self._placeholder_chips_stylesheet())
         ph = QHBoxLayout(ph_gb)
         ph.addWidget(QLabel("Click to insert at cursor:"))
-        for token in [
-            "{INPUT}",
-            "{OUTPUT}",
-            "{AUDIO_TRACK}",
-            "{SUBTITLE_TRACK}",
-            "{SUBTITLE_FILE}",
-        ]:
+        for token in self._PLACEHOLDER_CHIP_STYLES:
             ph.addWidget(self._placeholder_chip(token))
         ph.addStretch()
         root.addWidget(ph_gb)
@@ -258,6 +318,19 @@ class FFmpegTab(QWidget):
         self._mode_par.toggled.connect(lambda: config.set_encoding_mode("parallel" if self._mode_par.isChecked() else "sequential"))
         opt.addWidget(self._mode_seq)
         opt.addWidget(self._mode_par)
+        opt.addWidget(QLabel("x264/x265 Preset:"))
+        self.x264_preset_combo = QComboBox()
+        self.x264_preset_combo.addItems(self._X264_PRESETS)
+        idx = self.x264_preset_combo.findText(config.get_x264_preset())
+        if idx < 0:
+            idx = self.x264_preset_combo.findText("medium")
+        self.x264_preset_combo.setCurrentIndex(idx)
+        self.x264_preset_combo.setToolTip(
+            "Added as -preset when the command encodes with libx264/libx265 and sets no preset.\n"
+            "Faster presets encode much quicker at a somewhat larger file size."
+        )
+        self.x264_preset_combo.currentTextChanged.connect(config.set_x264_preset)
+        opt.addWidget(self.x264_preset_combo)
         opt.addStretch()
         self.start_btn = self._btn("Start Encoding", self._start_encoding)
         opt.addWidget(self.start_btn)
@@ -282,7 +355,7 @@ class FFmpegTab(QWidget):
         outer.addWidget(log_fr)
 
         self._bridge.log_msg.connect(self._append_log)
-        self._bridge.progress.connect(self._apply_progress)
+        self._bridge.progress_ready.connect(self._flush_progress)
         self._bridge.reset_ui.connect(self._reset_ui_on_encode_end)
         self._bridge.toast.connect(self._emit_toast)
         self._bridge.status_text.connect(self.progress_display.set_status)
@@ -298,6 +371,10 @@ class FFmpegTab(QWidget):
     def is_encoding(self) -> bool:
         return self._is_encoding.is_set()
 
+    def shutdown(self) -> None:
+        """Drop queued prefetch work (e.g. on app exit); a running extraction is not waited for."""
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+
     _AF_OPTION_RE = re.compile(
         r"(?P<prefix>\s)-af\s+(?P<val>'[^']*'|\"[^\"]*\"|\S+)"
     )
@@ -309,30 +386,41 @@ class FFmpegTab(QWidget):
         b.clicked.connect(slot)
         return b
 
+    @staticmethod
+    def _placeholder_chip_name(token: str) -> str:
+        return "placeholderChip_" + token.strip("{}<>")
+
+    @classmethod
+    def _placeholder_chips_stylesheet(cls) -> str:
+        """One stylesheet for all chips, parsed once on their container instead of per button."""
+        if cls._placeholder_chips_css is None:
+            rules = []
+            for token, (bg, fg, hover) in cls._PLACEHOLDER_CHIP_STYLES.items():
+                name = cls._placeholder_chip_name(token)
+                rules.append(
+                    f"""
+                    QPushButton#{name} {{
+                        background-color: {bg};
+                        color: {fg};
+                        border: 1px solid {fg};
+                        border-radius: 5px;
+                        padding: 4px 8px;
+                        font-weight: 600;
+                        font-family: Consolas, "Courier New", monospace;
+                    }}
+                    QPushButton#{name}:hover, QPushButton#{name}:pressed {{
+                        background-color: {hover};
+                    }}
+                    """
+                )
+            cls._placeholder_chips_css = "".join(rules)
+        return cls._placeholder_chips_css
+
     def _placeholder_chip(self, token: str) -> QPushButton:
         b = QPushButton(token)
-        bg, fg, hover = self._PLACEHOLDER_CHIP_STYLES[token]
+        b.setObjectName(self._placeholder_chip_name(token))
         b.setCursor(Qt.CursorShape.PointingHandCursor)
-        b.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {bg};
-                color: {fg};
-                border: 1px solid {fg};
-                border-radius: 5px;
-                padding: 4px 8px;
-                font-weight: 600;
-                font-family: Consolas, "Courier New", monospace;
-            }}
-            QPushButton:hover {{
-                background-color: {hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {hover};
-            }}
-            """
-        )
-        b.clicked.connect(lambda: self._insert_placeholder(token))
+        b.clicked.connect(partial(self._insert_placeholder, token))
         return b
 
     # --- Audio Normalize / Loudnorm ---
@@ -405,8 +493,7 @@ class FFmpegTab(QWidget):
     def _upgrade_cmd_string_c_a_copy_for_loudnorm(self, cmd: str) -> str:
         codec, br = self._loudnorm_fallback_audio_codec_and_bitrate()
         repl = f"-c:a {codec} -b:a {br}k"
-        cmd = re.sub(r"-c:a\s+copy\b", repl, cmd)
-        return re.sub(r"-codec:a\s+copy\b", repl, cmd)
+        return _AUDIO_COPY_RE.sub(repl, cmd)
 
     def _ensure_audio_encode_when_loudnorm_argv(self, args: List[str]) -> List[str]:
         """loudnorm requires decoded audio; -c:a copy is invalid with -af loudnorm."""
@@ -432,6 +519,16 @@ class FFmpegTab(QWidget):
                 return out
         return out
 
+    @staticmethod
+    def _ensure_x264_preset_argv(args: List[str], preset: str) -> List[str]:
+        """Add ``-preset`` after a libx264/libx265 video codec when the command sets none."""
+        if not preset or any(a.startswith("-preset") for a in args):
+            return args
+        for i in range(len(args) - 1):
+            if args[i] in ("-c:v", "-codec:v", "-vcodec") and args[i + 1] in ("libx264", "libx265"):
+                return args[: i + 2] + ["-preset", preset] + args[i + 2:]
+        return args
+
     def _apply_loudnorm_to_current_cmd_text(self) -> None:
         """
         Update only the -af option in the current command template.
@@ -439,6 +536,7 @@ class FFmpegTab(QWidget):
         This preserves manual video encoding edits (e.g. NVENC encoder selection)
         while still letting the loudnorm toggle affect audio loudness.
         """
+        self._flush_command_preview()
         filter_expr = self._audio_filter_from_settings()
         cmd = self.cmd_text.toPlainText()
         if not cmd.strip():
@@ -479,8 +577,8 @@ class FFmpegTab(QWidget):
                 new_cmd = self._AF_OPTION_RE.sub(repl_enable, cmd, count=1)
             else:
                 insert_at: Optional[int] = None
-                for patt in [r"\s-c:a\b", r"\s-map_chapters\b", r"\s-y\b"]:
-                    m = re.search(patt, cmd)
+                for patt in _AF_INSERT_BEFORE_RES:
+                    m = patt.search(cmd)
                     if m:
                         insert_at = m.start()
                         break
@@ -517,18 +615,39 @@ class FFmpegTab(QWidget):
 
     # --- Preset Management ---
 
+    def _reload_config(self) -> None:
+        """Snapshot the config values used by the encode loop and logging.
+
+        Refreshed when the tab is shown, when tool paths change and at the start
+        of each batch, so settings cannot change underneath a running batch.
+        """
+        self._ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
+        self._handbrake_path = config.get_handbrake_path() or "HandBrakeCLI"
+        self._mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
+        self._output_ext = config.get_output_file_extension()
+        self._subtitle_settings = {
+            "subtitle_handling": config.get_subtitle_handling(),
+            "warn_on_ass_mux": config.get_warn_on_ass_mux(),
+            "warn_on_burn": config.get_warn_on_burn(),
+        }
+        self._external_subtitle_tag = config.get_external_subtitle_tag()
+        self._debug_logging = config.get_debug_logging()
+
+    def reload_from_config(self) -> None:
+        """Refresh cached config values (e.g. after Settings changed)."""
+        if not self._is_encoding.is_set():
+            self._reload_config()
+
     def _init_encoder(self) -> None:
-        ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
-        handbrake_path = config.get_handbrake_path() or "HandBrakeCLI"
-        mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
+        self._reload_config()
         self.encoder = Encoder(
-            ffmpeg_path=ffmpeg_path,
-            handbrake_path=handbrake_path,
+            ffmpeg_path=self._ffmpeg_path,
+            handbrake_path=self._handbrake_path,
             progress_callback=self._on_progress,
             log_callback=self._on_log,
         )
         self.track_analyzer = TrackAnalyzer(
-            mkvinfo_path=mkvinfo_path if mkvinfo_path != "mkvinfo" else None
+            mkvinfo_path=self._mkvinfo_path if self._mkvinfo_path != "mkvinfo" else None
         )
 
     def _refresh_preset_dropdown(self) -> None:
@@ -541,9 +660,13 @@ class FFmpegTab(QWidget):
 
     def _load_preset(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
-            self, "Select HandBrake preset JSON file", "", "JSON (*.json);;All (*.*)"
+            self,
+            "Select HandBrake preset JSON file",
+            FFmpegTab._last_preset_dir or str(Path.home()),
+            "JSON (*.json);;All (*.*)",
         )
         if path:
+            FFmpegTab._last_preset_dir = os.path.dirname(path)
             try:
                 self._load_preset_from_path(Path(path), save=True)
             except Exception as e:
@@ -553,6 +676,7 @@ class FFmpegTab(QWidget):
         self.preset_parser = PresetParser(preset_path)
         self.ffmpeg_translator = FFmpegTranslator(self.preset_parser)
         preset_name = self.preset_parser.get_preset_name()
+        self._current_preset_name = preset_name
         if save:
             config.save_preset(preset_name, preset_path)
             config.set_last_used_preset(preset_name)
@@ -562,21 +686,21 @@ class FFmpegTab(QWidget):
                 self.preset_combo.setCurrentIndex(i)
         else:
             config.set_last_used_preset(preset_name)
-        self._update_command_preview()
-        self._update_command_preview_display()
         self._on_log("INFO", f"Loaded preset: {preset_name}")
 
-        # Check for preset subtitle filter conflicts with subtitle policy
-        self._check_preset_subtitle_conflicts(preset_name, preset_path)
+        # Check for preset subtitle filter conflicts once the command is regenerated
+        self._pending_conflict_check = (preset_name, preset_path)
+        self._update_command_preview()
 
     def _on_preset_selected(self, choice: str) -> None:
-        if not choice:
+        if not choice or choice == self._current_preset_name:
             return
         pp = config.get_preset_path(choice)
         if pp:
             try:
                 self._load_preset_from_path(pp, save=False)
             except Exception as e:
+                self._current_preset_name = None
                 QMessageBox.critical(self, "Error", str(e))
                 self._refresh_preset_dropdown()
                 self.preset_combo.setCurrentIndex(0)
@@ -650,6 +774,7 @@ class FFmpegTab(QWidget):
 
         if reply == QMessageBox.StandardButton.Cancel:
             # User cancelled, clear the preset
+            self._current_preset_name = None
             self.cmd_text.setPlainText("")
             self.preset_combo.setCurrentIndex(0)
             self._on_log("INFO", "Preset loading cancelled")
@@ -664,19 +789,12 @@ class FFmpegTab(QWidget):
         """Remove subtitle burning filter from FFmpeg command."""
         cmd = self.cmd_text.toPlainText()
 
-        # Remove -vf subtitles=... pattern (handles simple cases)
-        # Pattern to match -vf "..." with subtitles filter
-        cmd = re.sub(r'-vf\s+"[^"]*subtitles=[^"]*"', '', cmd)
-        cmd = re.sub(r"-vf\s+'[^']*subtitles=[^']*'", '', cmd)
-        # For unquoted -vf (less common)
-        cmd = re.sub(r'-vf\s+\S*subtitles=\S+\s+', '', cmd)
-
-        # Also handle -filter_complex with subtitles
-        cmd = re.sub(r'-filter_complex\s+"[^"]*subtitles=[^"]*"', '', cmd)
-        cmd = re.sub(r"-filter_complex\s+'[^']*subtitles=[^']*'", '', cmd)
+        # Quoted and unquoted -vf, then -filter_complex, carrying a subtitles= filter
+        for patt in _SUBTITLE_FILTER_OPTION_RES:
+            cmd = patt.sub('', cmd)
 
         # Clean up excess whitespace
-        cmd = re.sub(r'\s+', ' ', cmd).strip()
+        cmd = _WHITESPACE_RUN_RE.sub(' ', cmd).strip()
 
         self.cmd_text.blockSignals(True)
         self.cmd_text.setPlainText(cmd)
@@ -751,7 +869,18 @@ class FFmpegTab(QWidget):
     # --- Command Preview ---
 
     def _update_command_preview(self) -> None:
+        """Schedule regeneration of the command from the loaded preset."""
+        self._cmd_regen_timer.start(100)
+
+    def _flush_command_preview(self) -> None:
+        """Run a pending command regeneration now (before reading ``cmd_text``)."""
+        if self._cmd_regen_timer.isActive():
+            self._cmd_regen_timer.stop()
+            self._do_update_command_preview()
+
+    def _do_update_command_preview(self) -> None:
         if not self.ffmpeg_translator:
+            self._pending_conflict_check = None
             return
         ph_in = Path("input.mkv")
         ph_out = Path(f"output{config.get_output_file_extension()}")
@@ -773,7 +902,7 @@ class FFmpegTab(QWidget):
                             subtitle_track_preview = tr.get("subtitle")
                     except Exception:
                         pass
-        cmd = self.ffmpeg_translator.get_command_string(
+        argv = self.ffmpeg_translator.build_command(
             input_file=ph_in,
             output_file=ph_out,
             audio_track=audio_preview,
@@ -782,9 +911,18 @@ class FFmpegTab(QWidget):
             audio_filter=self._audio_filter_from_settings(),
             audio_ffmpeg_stream_index=stream_preview,
         )
-        self.cmd_text.blockSignals(True)
-        self.cmd_text.setPlainText(cmd)
-        self.cmd_text.blockSignals(False)
+        cmd = FFmpegTranslator.join_command(argv)
+        self._generated_command = (cmd, tuple(argv))
+        # Re-selecting a preset or resetting often yields the same text; skip the document rebuild.
+        if cmd != self.cmd_text.toPlainText():
+            self.cmd_text.blockSignals(True)
+            self.cmd_text.setPlainText(cmd)
+            self.cmd_text.blockSignals(False)
+        self._update_command_preview_display()
+        pending = self._pending_conflict_check
+        self._pending_conflict_check = None
+        if pending is not None:
+            self._check_preset_subtitle_conflicts(*pending)
 
     def _detect_and_update_tracks(self) -> None:
         if not self.ffmpeg_translator:
@@ -848,7 +986,7 @@ class FFmpegTab(QWidget):
                 self.update_file_callback(0, files[0])
             ph_in = Path("input.mkv")
             ph_out = Path(f"output{config.get_output_file_extension()}")
-            cmd = self.ffmpeg_translator.get_command_string(
+            argv = self.ffmpeg_translator.build_command(
                 input_file=ph_in,
                 output_file=ph_out,
                 audio_track=audio_track,
@@ -856,6 +994,8 @@ class FFmpegTab(QWidget):
                 audio_filter=self._audio_filter_from_settings(),
                 audio_ffmpeg_stream_index=files[0].get("audio_ffmpeg_stream_index"),
             )
+            cmd = FFmpegTranslator.join_command(argv)
+            self._generated_command = (cmd, tuple(argv))
             self.cmd_text.setPlainText(cmd)
             self._update_command_preview_display()
             QMessageBox.information(self, "Tracks", "Tracks detected; command updated.")
@@ -876,6 +1016,8 @@ class FFmpegTab(QWidget):
             plain = self._generate_command_preview()
         except Exception as e:
             plain = f"Error generating preview: {e}"
+        if plain == self._last_preview_plain:
+            return
         self._last_preview_plain = plain
         try:
             self.preview_text.setHtml(ffmpeg_preview_to_html(plain))
@@ -907,7 +1049,7 @@ class FFmpegTab(QWidget):
         if not n:
             return
         c = config.get_ffmpeg_command(n)
-        if c:
+        if c and c != self.cmd_text.toPlainText():
             self.cmd_text.setPlainText(c)
             self._update_command_preview_display()
 
@@ -934,7 +1076,6 @@ class FFmpegTab(QWidget):
     def _reset_command(self) -> None:
         if self.ffmpeg_translator:
             self._update_command_preview()
-            self._update_command_preview_display()
         else:
             QMessageBox.warning(self, "No Preset", "Load a HandBrake preset first")
 
@@ -963,11 +1104,11 @@ class FFmpegTab(QWidget):
     def _on_saved_command_selected(self, choice: str) -> None:
         if choice:
             c = config.get_ffmpeg_command(choice)
-            if c:
+            if c and c != self.cmd_text.toPlainText():
                 self.cmd_text.setPlainText(c)
                 self._update_command_preview_display()
 
-    def _insert_placeholder(self, p: str) -> None:
+    def _insert_placeholder(self, p: str, _checked: bool = False) -> None:
         self.cmd_text.insertPlainText(p)
         self._schedule_preview_update()
 
@@ -990,20 +1131,22 @@ class FFmpegTab(QWidget):
             self.progress_display.set_status(s)
 
     def _on_progress(self, progress: EncodingProgress) -> None:
-        now = time.monotonic()
-        min_interval = 0.2
-        near = progress.percent is not None and progress.percent >= 100.0
-        if (
-            self._progress_ui_throttle_last is not None
-            and (now - self._progress_ui_throttle_last) < min_interval
-            and not near
-        ):
-            return
-        self._progress_ui_throttle_last = now
-        self._bridge.progress.emit(progress)
+        # Encode thread: keep only the newest update; the GUI applies it on its next flush.
+        with self._progress_lock:
+            first = self._progress_pending is None
+            self._progress_pending = progress
+        if first:
+            self._bridge.progress_ready.emit()
+
+    def _flush_progress(self) -> None:
+        with self._progress_lock:
+            progress = self._progress_pending
+            self._progress_pending = None
+        if progress is not None:
+            self._apply_progress(progress)
 
     def _on_log(self, level: str, message: str) -> None:
-        if level == "DEBUG" and not config.get_debug_logging():
+        if level == "DEBUG" and not self._debug_logging:
             return
         self._bridge.log_msg.emit(level, message)
         p = f"[FFmpeg] {message}"
@@ -1034,6 +1177,7 @@ class FFmpegTab(QWidget):
     # --- Encoding Orchestration ---
 
     def _start_encoding(self) -> None:
+        self._flush_command_preview()
         cmd = self.cmd_text.toPlainText().strip()
         if not cmd:
             self._show_toast("Please load a preset or enter an FFmpeg command", "warning")
@@ -1045,6 +1189,7 @@ class FFmpegTab(QWidget):
             return
         if self.encoding_thread and self.encoding_thread.is_alive():
             self.encoding_thread.join(timeout=2.0)
+        self._reload_config()
         self._is_encoding.set()
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
@@ -1052,54 +1197,88 @@ class FFmpegTab(QWidget):
             self.encoder.reset_stop_event()
         self.batch_stats = BatchStats()
         cmd_snapshot = self.cmd_text.toPlainText().strip()
+        generated = self._generated_command
+        argv_template = generated[1] if generated and generated[0] == cmd_snapshot else None
         self.encoding_thread = threading.Thread(
             target=self._encode_files,
-            args=(self.get_files_callback(), cmd_snapshot),
+            args=(self.get_files_callback(), cmd_snapshot, argv_template),
             daemon=True,
         )
         self.encoding_thread.start()
 
-    def _encode_files(self, files, command_template: str) -> None:
+    def _encode_files(
+        self, files, command_template: str, argv_template: Optional[Tuple[str, ...]] = None
+    ) -> None:
         dry_run = self.dry_run_cb.isChecked()
         skip_existing = self.skip_cb.isChecked()
         suffix = self.suffix_entry.text()
-        ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
+        ffmpeg_path = self._ffmpeg_path
+        output_ext = self._output_ext
+        subtitle_settings = self._subtitle_settings
+        sub_tag = self._external_subtitle_tag  # 'default' or 'forced'
+        get_output_path = self.get_output_path_callback
+        custom_override = self.custom_command_override_cb.isChecked()
+        x264_preset = self.x264_preset_combo.currentText()
+        log = self._on_log
+        emit_file_updated = self._bridge.file_updated.emit
+        if not command_template:
+            log("ERROR", "No FFmpeg command")
+            self._bridge.reset_ui.emit()
+            return
+        # index -> (subtitle stream id, future) for extractions started one file ahead
+        prefetched: Dict[int, Tuple[int, Future]] = {}
+        # index -> future of track analysis started while the previous file encodes
+        analyses: Dict[int, Future] = {}
         completed_count = 0
         skipped_count = 0
         error_count = 0
         for i, file_data in enumerate(files):
             if not self._is_encoding.is_set():
                 break
-            source_file = Path(file_data["path"])
+            if i + 1 < len(files) and (i + 1) not in analyses and not files[i + 1].get("tracks_from_user"):
+                analyses[i + 1] = self._prefetch_pool.submit(
+                    self.track_analyzer.analyze_tracks, Path(files[i + 1]["path"])
+                )
+            # The file list already stores a Path; reuse it rather than re-parsing the string.
+            source_file = file_data["path"]
+            if not isinstance(source_file, Path):
+                source_file = Path(source_file)
+            src_str = str(source_file)
+            src_name = source_file.name
+            src_stem = source_file.stem
             if file_data.get("tracks_from_user"):
                 if file_data.get("audio_track") is None:
-                    self._on_log("ERROR", f"No audio track set for {source_file.name}")
+                    log("ERROR", f"No audio track set for {src_name}")
                     file_data["status"] = "Error"
                     error_count += 1
                     continue
                 effective_audio = file_data["audio_track"]
                 subtitle_track = file_data.get("subtitle_track")
-                self._on_log("INFO", f"Using tracks from file list for: {source_file.name}")
+                log("INFO", f"Using tracks from file list for: {src_name}")
             else:
-                self._on_log("INFO", f"Analyzing tracks for: {source_file.name}")
-                tracks = self.track_analyzer.analyze_tracks(source_file)
+                log("INFO", f"Analyzing tracks for: {src_name}")
+                pending_analysis = analyses.pop(i, None)
+                if pending_analysis is not None:
+                    tracks = pending_analysis.result()
+                else:
+                    tracks = self.track_analyzer.analyze_tracks(source_file)
                 if tracks.get("error"):
-                    self._on_log("ERROR", f"Track analysis failed: {tracks['error']}")
+                    log("ERROR", f"Track analysis failed: {tracks['error']}")
                     file_data["status"] = "Error"
                     error_count += 1
                     continue
                 effective_audio, subtitle_track = compute_effective_tracks(
                     tracks,
                     self.track_analyzer,
-                    log_info=lambda msg: self._on_log("INFO", msg),
-                    source_label=source_file.name,
+                    log_info=lambda msg: log("INFO", msg),
+                    source_label=src_name,
                 )
                 if not effective_audio:
-                    self._on_log("WARNING", f"No English audio: {source_file.name}")
+                    log("WARNING", f"No English audio: {src_name}")
                     file_data["status"] = "Skipped"
                     if self.batch_stats:
                         self.batch_stats.add_file_result(
-                            filename=source_file.name,
+                            filename=src_name,
                             elapsed=0,
                             input_size=0,
                             output_size=0,
@@ -1126,22 +1305,17 @@ class FFmpegTab(QWidget):
                             break
 
             # Detect and apply subtitle policy (unless Custom Override is enabled)
-            if self.custom_command_override_cb.isChecked():
+            if custom_override:
                 # Skip subtitle handling with custom override
                 subtitle_decision = None
                 file_data["subtitle_strategy"] = "Custom Override - disabled"
             else:
-                subtitle_settings = {
-                    "subtitle_handling": config.get_subtitle_handling(),
-                    "warn_on_ass_mux": config.get_warn_on_ass_mux(),
-                    "warn_on_burn": config.get_warn_on_burn()
-                }
                 subtitle_decision = process_file_subtitles(
                     source_file,
                     subtitle_settings,
                     ffmpeg_path,
                     ffprobe_path=None,
-                    log_callback=lambda lev, msg: self._on_log(lev, msg)
+                    log_callback=log
                 )
                 file_data["subtitle_strategy"] = subtitle_decision.reason
 
@@ -1150,7 +1324,7 @@ class FFmpegTab(QWidget):
                 file_data["status"] = "Skipped"
                 if self.batch_stats:
                     self.batch_stats.add_file_result(
-                        filename=source_file.name,
+                        filename=src_name,
                         elapsed=0,
                         input_size=0,
                         output_size=0,
@@ -1160,19 +1334,21 @@ class FFmpegTab(QWidget):
                 skipped_count += 1
                 continue
 
-            self._bridge.file_updated.emit(i, file_data)
+            emit_file_updated(i, file_data)
             output_dir = (
-                self.get_output_path_callback(source_file)
-                if self.get_output_path_callback
-                else source_file.parent
+                str(get_output_path(source_file))
+                if get_output_path
+                else os.path.dirname(src_str)
             )
-            output_file = output_dir / f"{source_file.stem}{suffix}{config.get_output_file_extension()}"
-            if skip_existing and not file_data.get("reencode", False) and output_file.exists():
-                self._on_log("INFO", f"Skipping (exists): {output_file.name}")
+            out_name = src_stem + suffix + output_ext
+            out_str = os.path.join(output_dir, out_name)
+            output_file = Path(out_str)
+            if skip_existing and not file_data.get("reencode", False) and os.path.exists(out_str):
+                log("INFO", f"Skipping (exists): {out_name}")
                 file_data["status"] = "Skipped"
                 if self.batch_stats:
                     self.batch_stats.add_file_result(
-                        filename=source_file.name,
+                        filename=src_name,
                         elapsed=0,
                         input_size=0,
                         output_size=0,
@@ -1182,12 +1358,12 @@ class FFmpegTab(QWidget):
                 skipped_count += 1
                 continue
             file_data["status"] = "Encoding"
-            self._bridge.file_updated.emit(i, file_data)
+            emit_file_updated(i, file_data)
 
             # Extract text-based subtitles to external files if policy requires it
             # (skip if Custom Override is enabled)
             extracted_subtitle_file = None
-            if (not self.custom_command_override_cb.isChecked() and
+            if (not custom_override and
                 subtitle_decision and
                 subtitle_decision.action == "external" and
                 subtitle_decision.codec and
@@ -1204,10 +1380,11 @@ class FFmpegTab(QWidget):
                     # Get language code and tag for Jellyfin-compatible naming
                     # Format: filename.tag.language.ext (e.g., episode.default.ja.ass)
                     lang_code = file_data.get("subtitle_language", "en")  # Default to 'en' if not detected
-                    sub_tag = config.get_external_subtitle_tag()  # 'default' or 'forced'
 
                     # Build filename with tag and language following Jellyfin convention
-                    external_sub_path = output_dir / f"{source_file.stem}{suffix}.{sub_tag}.{lang_code}{sub_ext}"
+                    external_sub_path = Path(
+                        os.path.join(output_dir, f"{src_stem}{suffix}.{sub_tag}.{lang_code}{sub_ext}")
+                    )
 
                     # Policy uses ffprobe's first subtitle stream; file list may target another (e.g. Signs).
                     external_stream_id = (
@@ -1224,25 +1401,26 @@ class FFmpegTab(QWidget):
                     )
                     if extracted_file:
                         extracted_subtitle_file = extracted_file
-                        self._on_log("INFO", f"Extracted {subtitle_decision.codec} subtitle ({lang_code}) to {extracted_file.name}")
+                        log("INFO", f"Extracted {subtitle_decision.codec} subtitle ({lang_code}) to {extracted_file.name}")
                     elif extraction_err:
-                        self._on_log("WARNING", f"Could not extract subtitle: {extraction_err}")
+                        log("WARNING", f"Could not extract subtitle: {extraction_err}")
 
             subtitle_file = None
+            pending = prefetched.pop(i, None)
             if subtitle_track is not None and not dry_run:
-                subtitle_file, err = extract_subtitle_stream(
-                    ffmpeg_path=ffmpeg_path,
-                    input_file=source_file,
-                    subtitle_stream_id=subtitle_track,
-                )
-                if subtitle_file and subtitle_file.exists() and subtitle_file.stat().st_size == 0:
+                subtitle_file, err = self._take_prefetched_subtitle(pending, subtitle_track)
+                if subtitle_file is None and err is None:
+                    subtitle_file, err = extract_subtitle_stream(
+                        ffmpeg_path=ffmpeg_path,
+                        input_file=source_file,
+                        subtitle_stream_id=subtitle_track,
+                    )
+                if subtitle_file and _is_empty_file(subtitle_file):
                     subtitle_file = None
                 elif not subtitle_file:
-                    self._on_log("WARNING", f"Subtitle extract issue: {err or 'unknown'}")
-            if not command_template:
-                self._on_log("ERROR", "No FFmpeg command")
-                error_count += 1
-                continue
+                    log("WARNING", f"Subtitle extract issue: {err or 'unknown'}")
+            elif pending is not None:
+                self._discard_prefetched_subtitle(pending[1])
             try:
                 ffmpeg_args = parse_and_substitute_command(
                     command_template,
@@ -1251,8 +1429,10 @@ class FFmpegTab(QWidget):
                     effective_audio,
                     subtitle_track,
                     subtitle_file,
-                    lambda lev, msg: self._on_log(lev, msg),
+                    log,
                     audio_ffmpeg_stream_index=file_data.get("audio_ffmpeg_stream_index"),
+                    ffmpeg_path=ffmpeg_path,
+                    argv_template=argv_template,
                 )
                 if not ffmpeg_args:
                     file_data["status"] = "Error"
@@ -1260,20 +1440,20 @@ class FFmpegTab(QWidget):
                     continue
 
                 # Apply app settings optimizations unless Custom Override is enabled
-                if not self.custom_command_override_cb.isChecked():
+                if not custom_override:
                     # Remove subtitle filters that conflict with our subtitle policy decision
                     # Work directly with ffmpeg_args list to avoid quote escaping issues
                     ffmpeg_args = self._remove_conflicting_subtitle_filters_from_args(ffmpeg_args, subtitle_decision)
                     ffmpeg_args = self._ensure_audio_encode_when_loudnorm_argv(ffmpeg_args)
-                    self._on_log("INFO", f"Applied app settings optimizations to command")
+                    ffmpeg_args = self._ensure_x264_preset_argv(ffmpeg_args, x264_preset)
+                    log("INFO", f"Applied app settings optimizations to command")
                 else:
-                    self._on_log("INFO", f"Custom Command Override enabled - using command as-is")
+                    log("INFO", f"Custom Command Override enabled - using command as-is")
             except Exception as e:
-                self._on_log("ERROR", str(e))
+                log("ERROR", str(e))
                 file_data["status"] = "Error"
                 error_count += 1
                 continue
-            self._progress_ui_throttle_last = None
             t0 = time.time()
             # Text subs (ASS/SRT/…) must keep the libass ``subtitles=`` filter + sidecar; bitmap
             # rewrite replaces it with overlay [0:N] which is for PGS and breaks ASS burn quality/track choice.
@@ -1281,6 +1461,19 @@ class FFmpegTab(QWidget):
                 subtitle_decision is not None
                 and subtitle_decision.codec in TEXT_SUBTITLE_CODECS
             )
+            if not dry_run and i + 1 < len(files):
+                next_data = files[i + 1]
+                next_sub = next_data.get("subtitle_track")
+                if next_sub is not None and (i + 1) not in prefetched:
+                    prefetched[i + 1] = (
+                        next_sub,
+                        self._prefetch_pool.submit(
+                            extract_subtitle_stream,
+                            ffmpeg_path=ffmpeg_path,
+                            input_file=Path(next_data["path"]),
+                            subtitle_stream_id=next_sub,
+                        ),
+                    )
             try:
                 ok = self.encoder.encode_with_ffmpeg(
                     input_file=source_file,
@@ -1292,27 +1485,34 @@ class FFmpegTab(QWidget):
                     dry_run=dry_run,
                 )
             except Exception as e:
-                self._on_log("ERROR", str(e))
+                log("ERROR", str(e))
                 ok = False
             elapsed = time.time() - t0
-            if subtitle_file and subtitle_file.exists():
+            if subtitle_file:
                 try:
-                    subtitle_file.unlink()
+                    subtitle_file.unlink(missing_ok=True)
                 except Exception:
                     pass
             if ok:
                 file_data["status"] = "Complete"
                 file_data["reencode"] = False
-                out_sz = 0
-                if output_file.exists():
+                # One stat per file: a missing file raises instead of needing exists() first.
+                try:
+                    out_sz = os.path.getsize(out_str)
+                except OSError:
+                    out_sz = 0
+                else:
                     file_data["output_path"] = output_file
-                    out_sz = output_file.stat().st_size
                     file_data["output_size"] = out_sz
                 if self.batch_stats:
+                    try:
+                        in_sz = os.path.getsize(src_str)
+                    except OSError:
+                        in_sz = 0
                     self.batch_stats.add_file_result(
-                        filename=source_file.name,
+                        filename=src_name,
                         elapsed=elapsed,
-                        input_size=source_file.stat().st_size if source_file.exists() else 0,
+                        input_size=in_sz,
                         output_size=out_sz,
                         success=True,
                     )
@@ -1320,13 +1520,13 @@ class FFmpegTab(QWidget):
                     try:
                         record_successful_encode(out_sz, elapsed)
                     except Exception as e:
-                        logger.warning(f"Could not update lifetime stats: {e}")
+                        logger.warning("Could not update lifetime stats: %s", e)
                 completed_count += 1
             else:
                 file_data["status"] = "Error"
                 if self.batch_stats:
                     self.batch_stats.add_file_result(
-                        filename=source_file.name,
+                        filename=src_name,
                         elapsed=elapsed,
                         input_size=0,
                         output_size=0,
@@ -1334,13 +1534,17 @@ class FFmpegTab(QWidget):
                         error_msg="failed",
                     )
                 error_count += 1
-            self._bridge.file_updated.emit(i, file_data)
+            emit_file_updated(i, file_data)
             if self.batch_stats and completed_count >= 3:
                 eta = self.batch_stats.calculate_batch_eta(len(files), completed_count)
                 if eta:
-                    self._on_log("INFO", f"Batch ETA: {eta}")
+                    log("INFO", f"Batch ETA: {eta}")
                     if "Batch ETA" not in self.progress_display.get_status():
                         self._bridge.status_text.emit(f"Batch ETA: {eta}")
+        for _track, future in prefetched.values():
+            self._discard_prefetched_subtitle(future)
+        for pending_analysis in analyses.values():
+            pending_analysis.cancel()
         if self.batch_stats:
             summary = self.batch_stats.summary_text()
             self._bridge.toast.emit(summary, "error" if error_count > 0 else "success")
@@ -1353,8 +1557,43 @@ class FFmpegTab(QWidget):
             )
         self._bridge.reset_ui.emit()
 
+    def _take_prefetched_subtitle(
+        self, pending: Optional[Tuple[int, Future]], subtitle_track: int
+    ) -> Tuple[Optional[Path], Optional[str]]:
+        """Return a prefetched extraction result, or ``(None, None)`` if none is usable."""
+        if pending is None:
+            return None, None
+        track, future = pending
+        if track != subtitle_track:
+            self._discard_prefetched_subtitle(future)
+            return None, None
+        try:
+            return future.result(timeout=_SUBTITLE_PREFETCH_TIMEOUT_SEC)
+        except Exception as e:
+            self._on_log("DEBUG", f"Prefetched subtitle unavailable, extracting now: {e}")
+            self._discard_prefetched_subtitle(future)
+            return None, None
+
+    @staticmethod
+    def _discard_prefetched_subtitle(future: Future) -> None:
+        """Delete the temp file of a prefetched extraction that will not be used."""
+        def cleanup(f: Future) -> None:
+            try:
+                path, _err = f.result()
+            except Exception:
+                return
+            if path is not None:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+        future.add_done_callback(cleanup)
+
     def _reset_ui_on_encode_end(self) -> None:
         self._is_encoding.clear()
+        with self._progress_lock:
+            self._progress_pending = None
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_display.reset()
@@ -142,6 +142,36 @@ class _CheckSubsWorker(QObject):
         self.finished.emit(results)
 
 
+class _ScanFolderWorker(QObject):
+    batch = pyqtSignal(object, list, list)
+    finished = pyqtSignal(int)
+
+    _BATCH_SIZE = 50
+
+    def __init__(self, folder: Path):
+        super().__init__()
+        self._folder = folder
+
+    def run(self) -> None:
+        # Paths are streamed in walk order so rows appear while the walk is running; sizes
+        # come from the walk's own stat so the UI thread does not stat each file again.
+        pending: List[Path] = []
+        sizes: List[int] = []
+        total = 0
+        for path, size in FileScanner().iter_directory_sizes(self._folder, recursive=True):
+            pending.append(path)
+            sizes.append(size)
+            if len(pending) >= self._BATCH_SIZE:
+                total += len(pending)
+                self.batch.emit(self._folder, pending, sizes)
+                pending = []
+                sizes = []
+        if pending:
+            total += len(pending)
+            self.batch.emit(self._folder, pending, sizes)
+        self.finished.emit(total)
+
+
 class FilesTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -157,6 +187,8 @@ class FilesTab(QWidget):
         self._set_tracks_btn: Optional[QPushButton] = None
         self._check_subs_busy = False
         self._check_subs_thread: Optional[QThread] = None
+        self._scan_busy = False
+        self._scan_thread: Optional[QThread] = None
 
         mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
         self.track_analyzer = TrackAnalyzer(
@@ -176,7 +208,8 @@ class FilesTab(QWidget):
         )
         row1.addWidget(self.scan_folder_label)
         row1.addWidget(self._btn("Browse", self._browse_scan_folder))
-        row1.addWidget(self._btn("Scan", self._scan_folder))
+        self._scan_btn = self._btn("Scan", self._scan_folder)
+        row1.addWidget(self._scan_btn)
         cv.addLayout(row1)
 
         row2 = QHBoxLayout()
@@ -423,6 +456,9 @@ class FilesTab(QWidget):
     def _ingest_local_paths(self, paths: List[Path]) -> int:
         """Add files or scan dropped/selected paths. Returns count of list entries added."""
         count = 0
+        # Consecutive loose files sharing a root go in as one add_files batch.
+        loose: List[Path] = []
+        loose_root: Optional[Path] = None
         for raw in paths:
             try:
                 path = raw.resolve()
@@ -433,13 +469,22 @@ class FilesTab(QWidget):
             if path.is_file():
                 if self.scanner.is_video_file(path):
                     root = path.parent.parent if path.parent != path else path.parent
-                    self.file_list.add_file(path, root=root)
-                    count += 1
+                    if loose and root != loose_root:
+                        count += self.file_list.add_files(loose, root=loose_root)
+                        loose = []
+                    loose_root = root
+                    loose.append(path)
             elif path.is_dir():
-                found = self.scanner.scan_directory(path, recursive=True)
-                for fp in found:
-                    self.file_list.add_file(fp, relative_to=path, root=path)
-                    count += 1
+                if loose:
+                    count += self.file_list.add_files(loose, root=loose_root)
+                    loose = []
+                # Sizes come from the same scandir walk, so add_files does not stat again.
+                found = sorted(self.scanner.iter_directory_sizes(path, recursive=True))
+                count += self.file_list.add_files(
+                    [p for p, _ in found], relative_to=path, root=path, sizes=[s for _, s in found]
+                )
+        if loose:
+            count += self.file_list.add_files(loose, root=loose_root)
         return count
 
     def _on_paths_dropped(self, paths: List[Path]) -> None:
@@ -453,17 +498,43 @@ class FilesTab(QWidget):
             self._show_toast("No video files found in the drop.", "warning")
 
     def _scan_folder(self) -> None:
+        if self._scan_busy:
+            return
         if not self.scan_folder:
             self._show_toast("Please select a scan folder first", "warning")
             return
+        self._scan_busy = True
+        self._scan_btn.setEnabled(False)
         self.file_list.clear()
-        files = self.scanner.scan_directory(self.scan_folder, recursive=True)
-        for fp in files:
-            self.file_list.add_file(fp, relative_to=self.scan_folder, root=self.scan_folder)
+        if self.on_status:
+            self.on_status(f"Scanning {self.scan_folder}…")
+
+        self._scan_thread = QThread()
+        self._scan_worker = _ScanFolderWorker(self.scan_folder)
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.batch.connect(self._on_scan_batch)
+        self._scan_worker.finished.connect(self._on_scan_finished)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_worker.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+        self._scan_thread.start()
+
+    def _on_scan_batch(self, folder: Path, paths: list, sizes: list) -> None:
+        self.file_list.add_files(paths, relative_to=folder, root=folder, sizes=sizes)
+        if self.on_status:
+            self.on_status(f"Scanning {folder}… {self.file_list.get_file_count()} found")
+
+    def _on_scan_finished(self, total: int) -> None:
+        self._scan_busy = False
+        self._scan_btn.setEnabled(True)
+        self.file_list.sort_by_path()
+        if self.on_status:
+            self.on_status(f"Ready - {self.file_list.get_file_count()} file(s) in queue")
         if self.on_files_changed:
             self.on_files_changed()
         self._update_preview()
-        self._show_toast(f"Found {len(files)} video file(s)", "success")
+        self._show_toast(f"Found {total} video file(s)", "success")
 
     def _add_files(self) -> None:
         paths, _ = QFileDialog.getOpenFileNames(
@@ -613,7 +684,8 @@ class FilesTab(QWidget):
                 f"No selectable audio (multi-track, no English match, Japanese mode off): {len(no_audio_names)} file(s)"
             )
         if not parts:
-            QMessageBox.information(self, "Load tracks", f"Updated track info for {len(results)} file(s).")
+            # Nothing to acknowledge: report without a modal so the window stays usable.
+            self._show_toast(f"Updated track info for {len(results)} file(s).", "success")
         else:
             QMessageBox.information(
                 self,
@@ -752,8 +824,7 @@ class FilesTab(QWidget):
                 strip_n = config.get_strip_leading_path_segments()
                 remaining = parts[strip_n:]
                 od = self.output_folder / Path(*remaining) if remaining else self.output_folder
-                od.mkdir(parents=True, exist_ok=True)
-                return od
+                return self._ensure_output_dir(od)
             except ValueError:
                 pass
         if self.scan_folder:
@@ -763,10 +834,16 @@ class FilesTab(QWidget):
                 strip_n = config.get_strip_leading_path_segments()
                 remaining = parts[strip_n:]
                 od = self.output_folder / Path(*remaining) if remaining else self.output_folder
-                od.mkdir(parents=True, exist_ok=True)
-                return od
+                return self._ensure_output_dir(od)
             except ValueError:
                 pass
-        od = self.output_folder / source_file.parent.name
-        od.mkdir(parents=True, exist_ok=True)
+        return self._ensure_output_dir(self.output_folder / source_file.parent.name)
+
+    def _ensure_output_dir(self, od: Path) -> Path:
+        """Create an output directory unless it already exists (one stat per file instead of a mkdir).
+
+        Nothing is cached, so a folder deleted or moved between batches is created again.
+        """
+        if not od.is_dir():
+            od.mkdir(parents=True, exist_ok=True)
         return od
@@ -7,7 +7,6 @@ the placeholders used here.
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -68,14 +67,16 @@ def generate_hb_command_preview(
     # Input / output
     input_q = _quote_path(str(source_file))
     output_q = _quote_path(str(output_file))
-    command = re.sub(r"\{INPUT\}", lambda _m: input_q, command)
-    command = re.sub(r"\{OUTPUT\}", lambda _m: output_q, command)
+    # Placeholders are plain literals, so str.replace is enough (and, unlike
+    # re.sub, needs no escaping of backslashes in Windows paths).
+    command = command.replace("{INPUT}", input_q)
+    command = command.replace("{OUTPUT}", output_q)
 
     # Audio track (HandBrake uses 1-based)
-    command = re.sub(r"\{AUDIO_TRACK\}", str(audio_track), command)
+    command = command.replace("{AUDIO_TRACK}", str(audio_track))
 
     # Subtitle track (HandBrake uses 1-based; internally stored as 0-based)
     if subtitle_track is not None:
-        command = re.sub(r"\{SUBTITLE_TRACK\}", str(subtitle_track + 1), command)
+        command = command.replace("{SUBTITLE_TRACK}", str(subtitle_track + 1))
 
     return command
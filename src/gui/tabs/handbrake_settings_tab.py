@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QGroupBox,
     QLabel,
+    QMessageBox,
     QPushButton,
     QScrollArea,
     QSpinBox,
@@ -391,7 +392,7 @@ class HandBrakeSettingsTab(QWidget):
             "File container (MP4, M4V, MKV, MOV, WebM) is set under Settings → Output Settings."
         )
         container_note.setWordWrap(True)
-        container_note.setStyleSheet("color: #888888; font-size: 12px;")
+        container_note.setProperty("role", "note")
         layout.addRow(container_note)
 
         self.optimize_cb = QCheckBox("Web optimize (moov atom at start)")
@@ -607,7 +608,6 @@ class HandBrakeSettingsTab(QWidget):
             parser = PresetParser(Path(path))
             self._apply_preset(parser)
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to load preset: {e}")
 
     def _apply_preset(self, parser: PresetParser) -> None:
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QGuiApplication
@@ -44,10 +46,15 @@ from storage import record_successful_encode
 from utils.config import config
 from utils.logger import logger
 
+# Track probes (mkvinfo) kept running ahead of the file being encoded.
+_ANALYSIS_LOOKAHEAD = 4
+# Parsed presets kept for switching back and forth in the dropdown.
+_PRESET_CACHE_MAX_ENTRIES = 16
+
 
 class _HandBrakeUiBridge(QObject):
     log_msg = pyqtSignal(str, str)
-    progress = pyqtSignal(object)
+    progress_ready = pyqtSignal()
     reset_ui = pyqtSignal()
     toast = pyqtSignal(str, str)
     status_text = pyqtSignal(str)
@@ -60,6 +67,10 @@ class HandBrakeTab(QWidget):
         self.main_window = None
         self.preset_parser: Optional[PresetParser] = None
         self.preset_path: Optional[Path] = None
+        # Name of the loaded preset; lets programmatic combo changes skip a reload.
+        self._current_preset_name: Optional[str] = None
+        # (path, mtime_ns) -> parsed preset, least recently used first.
+        self._preset_cache: "OrderedDict[Tuple[str, int], PresetParser]" = OrderedDict()
         self.encoder: Optional[Encoder] = None
         self.track_analyzer: Optional[TrackAnalyzer] = None
         self.encoding_thread: Optional[threading.Thread] = None
@@ -74,6 +85,12 @@ class HandBrakeTab(QWidget):
         self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
         self._preview_timer.timeout.connect(self._update_command_preview_display)
+        self._analysis_pool = ThreadPoolExecutor(
+            max_workers=_ANALYSIS_LOOKAHEAD, thread_name_prefix="hb-analyze"
+        )
+        # Newest progress from the encode thread; ProgressDisplay limits the repaint rate.
+        self._progress_lock = threading.Lock()
+        self._progress_pending: Optional[EncodingProgress] = None
 
         root = QVBoxLayout(self)
 
@@ -155,7 +172,7 @@ class HandBrakeTab(QWidget):
         root.addWidget(log_fr, stretch=1)
 
         self._bridge.log_msg.connect(self._append_log)
-        self._bridge.progress.connect(self._apply_progress)
+        self._bridge.progress_ready.connect(self._flush_progress)
         self._bridge.reset_ui.connect(self._reset_ui_on_encode_end)
         self._bridge.toast.connect(self._emit_toast)
         self._bridge.status_text.connect(self.progress_display.set_status)
@@ -170,6 +187,10 @@ class HandBrakeTab(QWidget):
     def is_encoding(self) -> bool:
         return self._is_encoding.is_set()
 
+    def shutdown(self) -> None:
+        """Drop queued track probes (e.g. on app exit); a running mkvinfo is not waited for."""
+        self._analysis_pool.shutdown(wait=False, cancel_futures=True)
+
     @property
     def _use_settings_mode(self) -> bool:
         return self._mode_settings.isChecked()
@@ -194,18 +215,33 @@ class HandBrakeTab(QWidget):
     def _persist_mode(self) -> None:
         config.set_encoding_mode("parallel" if self._mode_par.isChecked() else "sequential")
 
+    def _reload_config(self) -> None:
+        """Snapshot the config values used by the encode loop and logging.
+
+        Refreshed when the tab is shown, when tool paths change and at the start
+        of each batch, so settings cannot change underneath a running batch.
+        """
+        self._ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
+        self._handbrake_path = config.get_handbrake_path() or "HandBrakeCLI"
+        self._mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
+        self._output_ext = config.get_output_file_extension()
+        self._debug_logging = config.get_debug_logging()
+
+    def reload_from_config(self) -> None:
+        """Refresh cached config values (e.g. after Settings changed)."""
+        if not self._is_encoding.is_set():
+            self._reload_config()
+
     def _init_encoder(self) -> None:
-        ffmpeg_path = config.get_ffmpeg_path() or "ffmpeg"
-        handbrake_path = config.get_handbrake_path() or "HandBrakeCLI"
-        mkvinfo_path = config.get_mkvinfo_path() or "mkvinfo"
+        self._reload_config()
         self.encoder = Encoder(
-            ffmpeg_path=ffmpeg_path,
-            handbrake_path=handbrake_path,
+            ffmpeg_path=self._ffmpeg_path,
+            handbrake_path=self._handbrake_path,
             progress_callback=self._on_progress,
             log_callback=self._on_log,
         )
         self.track_analyzer = TrackAnalyzer(
-            mkvinfo_path=mkvinfo_path if mkvinfo_path != "mkvinfo" else None
+            mkvinfo_path=self._mkvinfo_path if self._mkvinfo_path != "mkvinfo" else None
         )
         self._schedule_preview_update()
 
@@ -230,10 +266,27 @@ class HandBrakeTab(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load preset: {e}")
 
+    def _parse_preset(self, preset_path: Path) -> PresetParser:
+        """Return a parsed preset, re-reading the JSON only when the file changed."""
+        try:
+            key = (str(preset_path), preset_path.stat().st_mtime_ns)
+        except OSError:
+            return PresetParser(preset_path)  # raises its usual "Failed to load preset" error
+        parser = self._preset_cache.get(key)
+        if parser is not None:
+            self._preset_cache.move_to_end(key)
+            return parser
+        parser = PresetParser(preset_path)
+        self._preset_cache[key] = parser
+        if len(self._preset_cache) > _PRESET_CACHE_MAX_ENTRIES:
+            self._preset_cache.popitem(last=False)
+        return parser
+
     def _load_preset_from_path(self, preset_path: Path, save: bool = False) -> None:
         self.preset_path = preset_path
-        self.preset_parser = PresetParser(self.preset_path)
+        self.preset_parser = self._parse_preset(preset_path)
         preset_name = self.preset_parser.get_preset_name()
+        self._current_preset_name = preset_name
         preset_desc = self.preset_parser.get_preset_description()
         if save:
             config.save_preset(preset_name, preset_path)
@@ -249,13 +302,14 @@ class HandBrakeTab(QWidget):
         self._schedule_preview_update()
 
     def _on_preset_selected(self, choice: str) -> None:
-        if not choice:
+        if not choice or choice == self._current_preset_name:
             return
         preset_path = config.get_preset_path(choice)
         if preset_path:
             try:
                 self._load_preset_from_path(preset_path, save=False)
             except Exception as e:
+                self._current_preset_name = None
                 QMessageBox.critical(self, "Error", f"Failed to load preset: {e}")
                 self._refresh_preset_dropdown()
                 self.preset_combo.setCurrentIndex(0)
@@ -406,10 +460,22 @@ class HandBrakeTab(QWidget):
             self.progress_display.set_status(status)
 
     def _on_progress(self, progress: EncodingProgress) -> None:
-        self._bridge.progress.emit(progress)
+        # Encode thread: keep only the newest update; the GUI applies it on its next flush.
+        with self._progress_lock:
+            first = self._progress_pending is None
+            self._progress_pending = progress
+        if first:
+            self._bridge.progress_ready.emit()
+
+    def _flush_progress(self) -> None:
+        with self._progress_lock:
+            progress = self._progress_pending
+            self._progress_pending = None
+        if progress is not None:
+            self._apply_progress(progress)
 
     def _on_log(self, level: str, message: str) -> None:
-        if level == "DEBUG" and not config.get_debug_logging():
+        if level == "DEBUG" and not self._debug_logging:
             return
         self._bridge.log_msg.emit(level, message)
         prefixed = f"[HandBrake] {message}"
@@ -451,6 +517,7 @@ class HandBrakeTab(QWidget):
             return
         if self.encoding_thread and self.encoding_thread.is_alive():
             self.encoding_thread.join(timeout=2.0)
+        self._reload_config()
         self._is_encoding.set()
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
@@ -466,16 +533,28 @@ class HandBrakeTab(QWidget):
         suffix = self.suffix_entry.text()
         use_settings = self._use_settings_mode
         hb_settings = None
-        output_ext = config.get_output_file_extension()
+        output_ext = self._output_ext
         if use_settings and self.hb_settings_tab:
             hb_settings = self.hb_settings_tab.get_settings_dict()
+        # index -> future of a track analysis started while earlier files encode
+        analyses: Dict[int, Future] = {}
+        next_analysis = 0
         completed_count = 0
         skipped_count = 0
         error_count = 0
         for i, file_data in enumerate(files):
             if not self._is_encoding.is_set():
                 break
-            source_file = Path(file_data["path"])
+            lookahead_end = min(len(files), i + 1 + _ANALYSIS_LOOKAHEAD)
+            while next_analysis < lookahead_end:
+                if not files[next_analysis].get("tracks_from_user"):
+                    analyses[next_analysis] = self._analysis_pool.submit(
+                        self.track_analyzer.analyze_tracks, Path(files[next_analysis]["path"])
+                    )
+                next_analysis += 1
+            source_file = file_data["path"]
+            if not isinstance(source_file, Path):
+                source_file = Path(source_file)
             if file_data.get("tracks_from_user"):
                 stored_audio = file_data.get("audio_track")
                 if stored_audio is None:
@@ -492,7 +571,11 @@ class HandBrakeTab(QWidget):
                 file_data["subtitle_track"] = subtitle_track
             else:
                 self._on_log("INFO", f"Analyzing tracks for: {source_file.name}")
-                tracks = self.track_analyzer.analyze_tracks(source_file)
+                pending_analysis = analyses.pop(i, None)
+                if pending_analysis is not None:
+                    tracks = pending_analysis.result()
+                else:
+                    tracks = self.track_analyzer.analyze_tracks(source_file)
                 if tracks.get("error"):
                     self._on_log("ERROR", f"Track analysis failed: {tracks['error']}")
                     file_data["status"] = "Error"
@@ -570,11 +653,17 @@ class HandBrakeTab(QWidget):
             if success:
                 file_data["status"] = "Complete"
                 file_data["reencode"] = False
-                input_size = source_file.stat().st_size if source_file.exists() else 0
-                output_size = 0
-                if output_file.exists():
-                    file_data["output_path"] = output_file
+                # One stat per file: a missing file raises instead of needing exists() first.
+                try:
+                    input_size = source_file.stat().st_size
+                except OSError:
+                    input_size = 0
+                try:
                     output_size = output_file.stat().st_size
+                except OSError:
+                    output_size = 0
+                else:
+                    file_data["output_path"] = output_file
                     file_data["output_size"] = output_size
                 if self.batch_stats:
                     self.batch_stats.add_file_result(
@@ -588,7 +677,7 @@ class HandBrakeTab(QWidget):
                     try:
                         record_successful_encode(output_size, file_elapsed_time)
                     except Exception as e:
-                        logger.warning(f"Could not update lifetime stats: {e}")
+                        logger.warning("Could not update lifetime stats: %s", e)
                 completed_count += 1
             else:
                 file_data["status"] = "Error"
@@ -611,6 +700,8 @@ class HandBrakeTab(QWidget):
                     if "Batch ETA" not in cur:
                         self._bridge.status_text.emit(f"Batch ETA: {eta}")
 
+        for pending_analysis in analyses.values():
+            pending_analysis.cancel()
         if self.batch_stats:
             summary = self.batch_stats.summary_text()
             toast_type = "error" if error_count > 0 else "success"
@@ -626,6 +717,8 @@ class HandBrakeTab(QWidget):
 
     def _reset_ui_on_encode_end(self) -> None:
         self._is_encoding.clear()
+        with self._progress_lock:
+            self._progress_pending = None
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_display.reset()
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import re
 import shutil
+from functools import partial
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Dict, List
 
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QHideEvent, QShowEvent
 from PyQt6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
@@ -29,13 +33,35 @@ from PyQt6.QtWidgets import (
 from core.package_manager import PackageManager
 from utils.config import config
 
+# Free-text fields are saved once typing pauses instead of on every keystroke.
+_TEXT_SAVE_DEBOUNCE_MS = 400
+# One entry of a comma-separated list, without surrounding whitespace (empty entries never match).
+_LIST_ITEM_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+_EXECUTABLE_FILTER = "Executable (*.exe);;All (*.*)"
+
 
 class SettingsTab(QWidget):
     main_window: Any = None
 
+    # Comma-separated track-detection lists: (row label, config getter, config setter).
+    _TRACK_LIST_FIELDS = (
+        ("Audio language tags:", config.get_audio_language_tags, config.set_audio_language_tags),
+        ("Audio name patterns:", config.get_audio_name_patterns, config.set_audio_name_patterns),
+        ("Audio exclude patterns:", config.get_audio_exclude_patterns, config.set_audio_exclude_patterns),
+        ("Subtitle language tags:", config.get_subtitle_language_tags, config.set_subtitle_language_tags),
+        ("Subtitle name patterns:", config.get_subtitle_name_patterns, config.set_subtitle_name_patterns),
+        ("Subtitle exclude patterns:", config.get_subtitle_exclude_patterns, config.set_subtitle_exclude_patterns),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.package_manager = PackageManager()
+        self._pending_text_saves: Dict[QLineEdit, Callable[[str], None]] = {}
+        self._text_save_timer = QTimer(self)
+        self._text_save_timer.setSingleShot(True)
+        self._text_save_timer.timeout.connect(self.flush_pending_edits)
+        # Folder of the last executable picked, for tools whose path field is still empty.
+        self._last_browse_dir = ""
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -43,20 +69,43 @@ class SettingsTab(QWidget):
         scroll.setWidget(inner)
         root = QVBoxLayout(inner)
 
+        # Only Paths is built up front; the other groups are added one per event-loop
+        # turn so the main window shows without waiting on every settings widget.
         root.addWidget(self._paths_group())
-        root.addWidget(self._output_group())
-        root.addWidget(self._files_defaults_group())
-        root.addWidget(self._encoding_group())
-        root.addWidget(self._subtitle_group())
-        root.addWidget(self._track_group())
-        root.addWidget(self._community_stats_group())
         root.addStretch()
+        self._sections_layout = root
+        self._pending_sections: List[Callable[[], QGroupBox]] = [
+            self._output_group,
+            self._files_defaults_group,
+            self._encoding_group,
+            self._subtitle_group,
+            self._track_group,
+            self._community_stats_group,
+        ]
+        QTimer.singleShot(0, self._build_next_section)
 
         lay = QVBoxLayout(self)
         lay.addWidget(scroll)
         lay.addWidget(QLabel("Settings save automatically when changed."))
         lay.addWidget(self._btn("Save All Settings", self._save_all))
 
+    def _build_next_section(self) -> None:
+        if not self._pending_sections:
+            return
+        build = self._pending_sections.pop(0)
+        # Insert above the trailing stretch.
+        self._sections_layout.insertWidget(self._sections_layout.count() - 1, build())
+        if self._pending_sections:
+            QTimer.singleShot(0, self._build_next_section)
+
+    def _ensure_sections_built(self) -> None:
+        while self._pending_sections:
+            self._build_next_section()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        self._ensure_sections_built()
+        super().showEvent(event)
+
     def _btn(self, t, fn):
         b = QPushButton(t)
         b.clicked.connect(fn)
@@ -108,34 +157,39 @@ class SettingsTab(QWidget):
         )
         return g
 
-    def _browse_ffmpeg(self, e):
-        p, _ = QFileDialog.getOpenFileName(self, "FFmpeg", "", "Executable (*.exe);;All (*.*)")
+    def _browse_executable(self, e: QLineEdit, title: str) -> str:
+        """Pick an executable, starting next to the current one (or the last pick)."""
+        current = e.text().strip()
+        start = str(Path(current).parent) if current else self._last_browse_dir
+        p, _ = QFileDialog.getOpenFileName(self, title, start, _EXECUTABLE_FILTER)
         if p:
+            self._last_browse_dir = str(Path(p).parent)
             e.setText(p)
+        return p
+
+    def _browse_ffmpeg(self, e):
+        p = self._browse_executable(e, "FFmpeg")
+        if p:
             config.set_ffmpeg_path(p)
 
     def _browse_ffprobe(self, e):
-        p, _ = QFileDialog.getOpenFileName(self, "ffprobe", "", "Executable (*.exe);;All (*.*)")
+        p = self._browse_executable(e, "ffprobe")
         if p:
-            e.setText(p)
             config.set_ffprobe_path(p)
 
     def _browse_hb(self, e):
-        p, _ = QFileDialog.getOpenFileName(self, "HandBrake CLI", "", "Executable (*.exe);;All (*.*)")
+        p = self._browse_executable(e, "HandBrake CLI")
         if p:
-            e.setText(p)
             config.set_handbrake_path(p)
 
     def _browse_mkv(self, e):
-        p, _ = QFileDialog.getOpenFileName(self, "mkvinfo", "", "Executable (*.exe);;All (*.*)")
+        p = self._browse_executable(e, "mkvinfo")
         if p:
-            e.setText(p)
             config.set_mkvinfo_path(p)
 
     def _browse_mi(self, e):
-        p, _ = QFileDialog.getOpenFileName(self, "MediaInfo", "", "Executable (*.exe);;All (*.*)")
+        p = self._browse_executable(e, "MediaInfo")
         if p:
-            e.setText(p)
             config.set_mediainfo_path(p)
 
     def _auto_ffmpeg(self, e):
@@ -182,7 +236,7 @@ class SettingsTab(QWidget):
         g = QGroupBox("Output Settings")
         f = QFormLayout(g)
         self.suffix_entry = QLineEdit(config.get_default_output_suffix())
-        self.suffix_entry.textChanged.connect(lambda t: config.set_default_output_suffix(t))
+        self._save_on_edit(self.suffix_entry, config.set_default_output_suffix)
         f.addRow("Default output suffix:", self.suffix_entry)
 
         self.output_container_combo = QComboBox()
@@ -220,7 +274,7 @@ class SettingsTab(QWidget):
             "(switch to Files to refresh the view after changes here)."
         )
         note.setWordWrap(True)
-        note.setStyleSheet("color: #888888; font-size: 12px;")
+        note.setProperty("role", "note")
         outer = QVBoxLayout(g)
         outer.addWidget(note)
         form = QFormLayout()
@@ -474,6 +528,7 @@ class SettingsTab(QWidget):
 
     def reload_from_config(self) -> None:
         """Refresh widgets from config (when user opens this tab)."""
+        self._ensure_sections_built()
         self.ffmpeg_entry.blockSignals(True)
         self.ffmpeg_entry.setText(config.get_ffmpeg_path() or "")
         self.ffmpeg_entry.blockSignals(False)
@@ -539,24 +594,10 @@ class SettingsTab(QWidget):
         self.ja_cb.setChecked(config.get_allow_japanese_audio_with_english_subs())
         self.ja_cb.toggled.connect(lambda x: config.set_allow_japanese_audio_with_english_subs(x))
         f.addRow(self.ja_cb)
-        self.audio_lang = QLineEdit(", ".join(config.get_audio_language_tags()))
-        self.audio_lang.textChanged.connect(self._save_audio_lang)
-        f.addRow("Audio language tags:", self.audio_lang)
-        self.audio_name = QLineEdit(", ".join(config.get_audio_name_patterns()))
-        self.audio_name.textChanged.connect(self._save_audio_name)
-        f.addRow("Audio name patterns:", self.audio_name)
-        self.audio_ex = QLineEdit(", ".join(config.get_audio_exclude_patterns()))
-        self.audio_ex.textChanged.connect(self._save_audio_ex)
-        f.addRow("Audio exclude patterns:", self.audio_ex)
-        self.sub_lang = QLineEdit(", ".join(config.get_subtitle_language_tags()))
-        self.sub_lang.textChanged.connect(self._save_sub_lang)
-        f.addRow("Subtitle language tags:", self.sub_lang)
-        self.sub_name = QLineEdit(", ".join(config.get_subtitle_name_patterns()))
-        self.sub_name.textChanged.connect(self._save_sub_name)
-        f.addRow("Subtitle name patterns:", self.sub_name)
-        self.sub_ex = QLineEdit(", ".join(config.get_subtitle_exclude_patterns()))
-        self.sub_ex.textChanged.connect(self._save_sub_ex)
-        f.addRow("Subtitle exclude patterns:", self.sub_ex)
+        for label, getter, setter in self._TRACK_LIST_FIELDS:
+            entry = QLineEdit(", ".join(getter()))
+            self._save_on_edit(entry, partial(self._save_list, getter, setter))
+            f.addRow(label, entry)
         return g
 
     def _community_stats_group(self) -> QGroupBox:
@@ -568,7 +609,7 @@ class SettingsTab(QWidget):
             "No file names or paths are sent."
         )
         note.setWordWrap(True)
-        note.setStyleSheet("color: #888888; font-size: 12px;")
+        note.setProperty("role", "note")
         v.addWidget(note)
         self.stats_api_enabled_cb = QCheckBox("Share encoding statistics")
         self.stats_api_enabled_cb.setChecked(config.get_stats_api_enabled())
@@ -584,26 +625,38 @@ class SettingsTab(QWidget):
         v.addLayout(form)
         return g
 
-    def _save_audio_lang(self, t: str) -> None:
-        config.set_audio_language_tags([x.strip() for x in t.split(",") if x.strip()])
-
-    def _save_audio_name(self, t: str) -> None:
-        config.set_audio_name_patterns([x.strip() for x in t.split(",") if x.strip()])
-
-    def _save_audio_ex(self, t: str) -> None:
-        config.set_audio_exclude_patterns([x.strip() for x in t.split(",") if x.strip()])
-
-    def _save_sub_lang(self, t: str) -> None:
-        config.set_subtitle_language_tags([x.strip() for x in t.split(",") if x.strip()])
-
-    def _save_sub_name(self, t: str) -> None:
-        config.set_subtitle_name_patterns([x.strip() for x in t.split(",") if x.strip()])
-
-    def _save_sub_ex(self, t: str) -> None:
-        config.set_subtitle_exclude_patterns([x.strip() for x in t.split(",") if x.strip()])
+    def _save_on_edit(self, entry: QLineEdit, save: Callable[[str], None]) -> None:
+        def schedule(_text: str) -> None:
+            self._pending_text_saves[entry] = save
+            self._text_save_timer.start(_TEXT_SAVE_DEBOUNCE_MS)
+
+        entry.textChanged.connect(schedule)
+
+    def flush_pending_edits(self) -> None:
+        """Save text fields still waiting on the typing debounce."""
+        self._text_save_timer.stop()
+        pending, self._pending_text_saves = self._pending_text_saves, {}
+        for entry, save in pending.items():
+            save(entry.text())
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        self.flush_pending_edits()
+        super().hideEvent(event)
+
+    def _save_list(
+        self,
+        getter: Callable[[], List[str]],
+        setter: Callable[[List[str]], None],
+        t: str,
+    ) -> None:
+        items = _LIST_ITEM_RE.findall(t)
+        if items != getter():
+            setter(items)
 
     def _save_all(self) -> None:
         try:
+            self._ensure_sections_built()
+            self.flush_pending_edits()
             config.set_ffmpeg_path(self.ffmpeg_entry.text().strip())
             config.set_ffprobe_path(self.ffprobe_entry.text().strip())
             config.set_handbrake_path(self.handbrake_entry.text().strip())
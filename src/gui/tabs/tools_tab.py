@@ -258,7 +258,7 @@ class ToolsTab(QWidget):
             "Bitmap subtitles are skipped. Output: VideoName.lang.Title.ext"
         )
         note.setWordWrap(True)
-        note.setStyleSheet("color: #888888; font-size: 12px;")
+        note.setProperty("role", "note")
         root.addWidget(note)
 
         btn_row = QHBoxLayout()
@@ -2,16 +2,38 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
-from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableWidget, QTableWidgetItem, QWidget
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
 
 from core.file_scanner import FileScanner
 
 
+@lru_cache(maxsize=256)
+def _format_track_str(audio_track, subtitle_track) -> str:
+    """Tracks column text; keyed on the values so direct edits to file dicts never go stale."""
+    track_str = ""
+    if audio_track:
+        track_str += f"Audio: {audio_track}"
+    if subtitle_track is not None:
+        if track_str:
+            track_str += ", "
+        track_str += f"Sub: {subtitle_track}"
+    return track_str or "Not analyzed"
+
+
 class _DropTable(QTableWidget):
     """Table that accepts file/folder drops and forwards local paths to the owner."""
 
@@ -58,6 +80,23 @@ class FileListWidget(QWidget):
     COL_SUB_TYPE = 4
     COL_STATUS = 5
 
+    # Between the source size and the encoded size in the Size column.
+    SIZE_SEP = " → "
+
+    # Sort key per sortable column, picked once per sort rather than per row.
+    _SORT_KEYS: Dict[int, Callable[[Dict], object]] = {
+        COL_PATH: lambda f: str(f["display_path"]).lower(),
+        COL_SIZE: lambda f: f.get("size", 0),
+        COL_TRACKS: lambda f: (str(f.get("audio_track", "")), str(f.get("subtitle_track", ""))),
+        COL_SUB_TYPE: lambda f: (f.get("sub_type") or "").lower(),
+        COL_STATUS: lambda f: f.get("status", "").lower(),
+    }
+
+    # Path cells are elided only for rows near the viewport; the item remembers the width
+    # it was elided for so scrolling back over it costs nothing.
+    _ELIDED_WIDTH_ROLE = Qt.ItemDataRole.UserRole
+    _VISIBLE_ROW_MARGIN = 8
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self.scanner = FileScanner()
@@ -68,6 +107,9 @@ class FileListWidget(QWidget):
         self._sort_reverse = False
         self._refresh_timer: Optional[QTimer] = None
         self._path_to_index: Dict[str, int] = {}
+        # Set by row removals; the path index is rebuilt on the next lookup instead.
+        self._path_index_stale = False
+        self._path_refresh_pending = False
 
         self._table = _DropTable(self, 0, 6)
         self._table.setHorizontalHeaderLabels(["", "Source Path", "Size", "Tracks", "Sub Type", "Status"])
@@ -78,6 +120,8 @@ class FileListWidget(QWidget):
         hdr.setSectionResizeMode(self.COL_TRACKS, QHeaderView.ResizeMode.Interactive)
         hdr.setSectionResizeMode(self.COL_SUB_TYPE, QHeaderView.ResizeMode.Interactive)
         hdr.setSectionResizeMode(self.COL_STATUS, QHeaderView.ResizeMode.Stretch)
+        # Size the ResizeToContents column from the rows on screen only, not every row in the list.
+        hdr.setResizeContentsPrecision(0)
         self._table.setColumnWidth(self.COL_SEL, 36)
         self._table.setColumnWidth(self.COL_PATH, 320)
         self._table.setColumnWidth(self.COL_TRACKS, 150)
@@ -91,8 +135,7 @@ class FileListWidget(QWidget):
         self._table.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
         self._table.horizontalHeader().sectionResized.connect(self._on_path_section_resized)
         self._table.itemSelectionChanged.connect(self._on_row_selected)
-
-        from PyQt6.QtWidgets import QVBoxLayout
+        self._table.verticalScrollBar().valueChanged.connect(self._on_table_scrolled)
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
@@ -102,8 +145,9 @@ class FileListWidget(QWidget):
         if self.on_paths_dropped:
             self.on_paths_dropped(paths)
 
-    def _path_cell_elided_display(self, path_str: str) -> str:
-        wpx = self._path_cell_available_width_px()
+    def _path_cell_elided_display(self, path_str: str, wpx: Optional[int] = None) -> str:
+        if wpx is None:
+            wpx = self._path_cell_available_width_px()
         return self._table.fontMetrics().elidedText(path_str, Qt.TextElideMode.ElideMiddle, wpx)
 
     def _path_cell_available_width_px(self) -> int:
@@ -114,25 +158,17 @@ class FileListWidget(QWidget):
         return max(40, col_w - 28)
 
     def _row_values(self, file_data: Dict) -> tuple:
+        """Full path, size, tracks and status text for a row (the path cell is elided by callers)."""
         path_str = str(file_data["display_path"])
-        display_path = self._path_cell_elided_display(path_str)
-        track_str = ""
-        if file_data.get("audio_track"):
-            track_str += f"Audio: {file_data['audio_track']}"
-        if file_data.get("subtitle_track") is not None:
-            if track_str:
-                track_str += ", "
-            track_str += f"Sub: {file_data['subtitle_track']}"
-        if not track_str:
-            track_str = "Not analyzed"
+        track_str = _format_track_str(file_data.get("audio_track"), file_data.get("subtitle_track"))
         size_str = file_data.get("size_str", "")
         if file_data.get("output_size") is not None:
-            size_str = f"{size_str} → {self.scanner.format_file_size(file_data['output_size'])}"
+            size_str = size_str + self.SIZE_SEP + self.scanner.format_file_size(file_data["output_size"])
         status = file_data.get("status", self.STATUS_PENDING)
-        return display_path, size_str, track_str, status, path_str
+        return path_str, size_str, track_str, status
 
     def _set_row(self, row: int, file_data: Dict) -> None:
-        display_path, size_str, track_str, status, full_path = self._row_values(file_data)
+        full_path, size_str, track_str, status = self._row_values(file_data)
         self._table.blockSignals(True)
         chk = QTableWidgetItem()
         chk.setFlags(
@@ -145,7 +181,8 @@ class FileListWidget(QWidget):
         )
         self._table.setItem(row, self.COL_SEL, chk)
 
-        it_path = QTableWidgetItem(display_path)
+        # Full text until _refresh_path_cells elides it (the view's ElideMiddle covers the gap).
+        it_path = QTableWidgetItem(full_path)
         it_path.setToolTip(full_path)
         it_path.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
         self._table.setItem(row, self.COL_PATH, it_path)
@@ -169,6 +206,34 @@ class FileListWidget(QWidget):
         self._table.setItem(row, self.COL_STATUS, it_st)
         self._table.blockSignals(False)
 
+    def _update_row(self, row: int, file_data: Dict) -> None:
+        """Rewrite a row's cell text in place; only rows without items get new ones."""
+        items = [self._table.item(row, col) for col in range(self._table.columnCount())]
+        if any(it is None for it in items):
+            self._set_row(row, file_data)
+            return
+        full_path, size_str, track_str, status = self._row_values(file_data)
+        check = Qt.CheckState.Checked if file_data.get("selected") else Qt.CheckState.Unchecked
+        self._table.blockSignals(True)
+        if items[self.COL_SEL].checkState() != check:
+            items[self.COL_SEL].setCheckState(check)
+        # The tooltip holds the unelided path; a new path is re-elided by the next refresh.
+        it_path = items[self.COL_PATH]
+        if it_path.toolTip() != full_path:
+            it_path.setText(full_path)
+            it_path.setToolTip(full_path)
+            it_path.setData(self._ELIDED_WIDTH_ROLE, None)
+            self._schedule_path_refresh()
+        for col, text in (
+            (self.COL_SIZE, size_str),
+            (self.COL_TRACKS, track_str),
+            (self.COL_SUB_TYPE, file_data.get("sub_type") or "—"),
+            (self.COL_STATUS, status),
+        ):
+            if items[col].text() != text:
+                items[col].setText(text)
+        self._table.blockSignals(False)
+
     def _on_item_changed(self, item: QTableWidgetItem) -> None:
         if item.column() != self.COL_SEL:
             return
@@ -208,75 +273,114 @@ class FileListWidget(QWidget):
     def _reapply_sort(self) -> None:
         if self._sort_column is None or not self.files:
             return
+        key = self._SORT_KEYS.get(self._sort_column)
+        if key is None:
+            return
+        self.files = sorted(self.files, key=key, reverse=self._sort_reverse)
+        self._rebuild_table()
 
-        def key_row(i: int):
-            f = self.files[i]
-            c = self._sort_column
-            if c == self.COL_PATH:
-                return str(f["display_path"]).lower()
-            if c == self.COL_SIZE:
-                return f.get("size", 0)
-            if c == self.COL_TRACKS:
-                return (str(f.get("audio_track", "")), str(f.get("subtitle_track", "")))
-            if c == self.COL_SUB_TYPE:
-                return (f.get("sub_type") or "").lower()
-            if c == self.COL_STATUS:
-                return f.get("status", "").lower()
-            return i
-
-        order = list(range(len(self.files)))
-        order.sort(key=key_row, reverse=self._sort_reverse)
-        new_files = [self.files[i] for i in order]
-        self.files = new_files
+    def sort_by_path(self) -> None:
+        """Put rows in path order (as scan_directory returns them); no-op when already sorted."""
+        keys = [fd["path"] for fd in self.files]
+        if all(a <= b for a, b in zip(keys, keys[1:])):
+            return
+        self.files.sort(key=lambda fd: fd["path"])
         self._rebuild_table()
 
     def _rebuild_path_index(self) -> None:
         self._path_to_index = {str(fd["path"]): i for i, fd in enumerate(self.files)}
+        self._path_index_stale = False
 
     def _rebuild_table(self) -> None:
         self._table.blockSignals(True)
         self._table.setRowCount(len(self.files))
         for idx, fd in enumerate(self.files):
-            self._set_row(idx, fd)
+            self._update_row(idx, fd)
         self._table.blockSignals(False)
         self._rebuild_path_index()
-        QTimer.singleShot(0, self._refresh_path_cells)
+        self._schedule_path_refresh()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        if self._refresh_timer:
-            self._refresh_timer.stop()
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.setSingleShot(True)
-        self._refresh_timer.timeout.connect(self._refresh_path_cells)
+        if self._refresh_timer is None:
+            self._refresh_timer = QTimer(self)
+            self._refresh_timer.setSingleShot(True)
+            self._refresh_timer.timeout.connect(self._refresh_path_cells)
         self._refresh_timer.start(50)
 
+    def _on_table_scrolled(self, _value: int) -> None:
+        self._schedule_path_refresh()
+
+    def _visible_row_range(self) -> range:
+        """Rows intersecting the viewport, padded by a few rows on each side."""
+        count = self._table.rowCount()
+        if count == 0:
+            return range(0)
+        first = self._table.rowAt(0)
+        last = self._table.rowAt(self._table.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = count - 1
+        return range(
+            max(0, first - self._VISIBLE_ROW_MARGIN),
+            min(count, last + 1 + self._VISIBLE_ROW_MARGIN),
+        )
+
+    def _schedule_path_refresh(self) -> None:
+        """Queue one path-cell refresh; repeated calls before it runs are coalesced."""
+        if self._path_refresh_pending:
+            return
+        self._path_refresh_pending = True
+        QTimer.singleShot(0, self._refresh_path_cells)
+
     def _refresh_path_cells(self) -> None:
-        for idx, fd in enumerate(self.files):
-            display_path, _, _, _, full_path = self._row_values(fd)
+        """Elide path cells for the rows on screen; off-screen rows wait until scrolled to."""
+        self._path_refresh_pending = False
+        wpx = self._path_cell_available_width_px()
+        for idx in self._visible_row_range():
+            if idx >= len(self.files):
+                break
             it = self._table.item(idx, self.COL_PATH)
-            if it:
+            if it is None:
+                continue
+            full_path = str(self.files[idx]["display_path"])
+            if it.data(self._ELIDED_WIDTH_ROLE) == wpx and it.toolTip() == full_path:
+                continue
+            display_path = self._path_cell_elided_display(full_path, wpx)
+            if it.text() != display_path:
                 it.setText(display_path)
+            if it.toolTip() != full_path:
                 it.setToolTip(full_path)
+            it.setData(self._ELIDED_WIDTH_ROLE, wpx)
 
-    def add_file(
+    def _make_file_data(
         self,
         file_path: Path,
-        relative_to: Optional[Path] = None,
-        root: Optional[Path] = None,
+        relative_to: Optional[Path],
+        root: Optional[Path],
+        relative_prefix: Optional[str] = None,
+        file_size: Optional[int] = None,
     ) -> Dict:
         if relative_to:
-            try:
-                display_path = file_path.relative_to(relative_to)
-            except ValueError:
-                display_path = file_path
+            # relative_prefix is str(relative_to) plus a separator, precomputed by add_files;
+            # a plain string slice covers scan results, relative_to() handles the rest.
+            path_str = str(file_path)
+            if relative_prefix and path_str.startswith(relative_prefix):
+                display_path = Path(path_str[len(relative_prefix):])
+            else:
+                try:
+                    display_path = file_path.relative_to(relative_to)
+                except ValueError:
+                    display_path = file_path
         else:
             display_path = file_path
         if root is None:
             root = relative_to if relative_to else file_path.parent
-        file_size = self.scanner.get_file_size(file_path)
+        if file_size is None:
+            file_size = self.scanner.get_file_size(file_path)
         size_str = self.scanner.format_file_size(file_size)
-        file_data: Dict = {
+        return {
             "path": file_path,
             "display_path": display_path,
             "root": root,
@@ -292,32 +396,98 @@ class FileListWidget(QWidget):
             "sub_type": None,
             "tracks_from_user": False,
         }
+
+    def add_file(
+        self,
+        file_path: Path,
+        relative_to: Optional[Path] = None,
+        root: Optional[Path] = None,
+        size: Optional[int] = None,
+    ) -> Dict:
+        """Append one file; pass ``size`` when the caller already stat'ed it."""
+        file_data = self._make_file_data(file_path, relative_to, root, file_size=size)
         self.files.append(file_data)
         self._path_to_index[str(file_data["path"])] = len(self.files) - 1
         row = len(self.files) - 1
         self._table.insertRow(row)
         self._set_row(row, file_data)
-        QTimer.singleShot(0, self._refresh_path_cells)
+        self._schedule_path_refresh()
         return file_data
 
+    def add_files(
+        self,
+        file_paths: Iterable[Path],
+        relative_to: Optional[Path] = None,
+        root: Optional[Path] = None,
+        sizes: Optional[Sequence[int]] = None,
+    ) -> int:
+        """Append many files with one row-count change and one path-cell refresh. Returns count added.
+
+        ``sizes`` (parallel to ``file_paths``) skips the per-file stat when the caller already has them.
+        """
+        start = len(self.files)
+        relative_prefix = None
+        if relative_to:
+            relative_prefix = str(relative_to)
+            if not relative_prefix.endswith(os.sep):
+                relative_prefix += os.sep
+        for i, fp in enumerate(file_paths):
+            file_size = sizes[i] if sizes is not None else None
+            file_data = self._make_file_data(fp, relative_to, root, relative_prefix, file_size)
+            self._path_to_index[str(fp)] = len(self.files)
+            self.files.append(file_data)
+        added = len(self.files) - start
+        if not added:
+            return 0
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._table.setRowCount(len(self.files))
+            for row in range(start, len(self.files)):
+                self._set_row(row, self.files[row])
+        finally:
+            self._table.setUpdatesEnabled(True)
+        self._schedule_path_refresh()
+        return added
+
     def update_file(self, index: int, **kwargs):
         path = kwargs.get("path")
         idx = index
         if path is not None:
+            if self._path_index_stale:
+                self._rebuild_path_index()
             idx = self._path_to_index.get(str(path), index)
         if 0 <= idx < len(self.files):
             self.files[idx].update(kwargs)
-            self._set_row(idx, self.files[idx])
+            self._update_row(idx, self.files[idx])
 
     def remove_file(self, index: int) -> None:
         if 0 <= index < len(self.files):
             self.files.pop(index)
-            self._rebuild_table()
-            self._rebuild_path_index()
+            self._table.removeRow(index)
+            self._path_index_stale = True
+
+    def remove_files(self, indices: Iterable[int]) -> int:
+        """Remove several rows with repaints suspended and one pass over the file list."""
+        doomed = sorted({i for i in indices if 0 <= i < len(self.files)}, reverse=True)
+        if not doomed:
+            return 0
+        self._table.blockSignals(True)
+        self._table.setUpdatesEnabled(False)
+        try:
+            for index in doomed:
+                self._table.removeRow(index)
+        finally:
+            self._table.setUpdatesEnabled(True)
+            self._table.blockSignals(False)
+        gone = set(doomed)
+        self.files[:] = [fd for i, fd in enumerate(self.files) if i not in gone]
+        self._path_index_stale = True
+        return len(doomed)
 
     def clear(self) -> None:
         self.files.clear()
         self._path_to_index.clear()
+        self._path_index_stale = False
         self._table.setRowCount(0)
 
     def get_files(self) -> List[Dict]:
@@ -338,19 +508,31 @@ class FileListWidget(QWidget):
             selected_indices = self.get_selected_indices()
         if not selected_indices:
             return 0
-        for index in sorted(selected_indices, reverse=True):
-            self.remove_file(index)
+        self.remove_files(selected_indices)
         return len(selected_indices)
 
+    def _set_all_selected(self, selected: bool) -> None:
+        """Flip every row's checkbox; the other cells are left untouched."""
+        check = Qt.CheckState.Checked if selected else Qt.CheckState.Unchecked
+        self._table.blockSignals(True)
+        self._table.setUpdatesEnabled(False)
+        try:
+            for row, fd in enumerate(self.files):
+                fd["selected"] = selected
+                it = self._table.item(row, self.COL_SEL)
+                if it is None:
+                    self._set_row(row, fd)
+                elif it.checkState() != check:
+                    it.setCheckState(check)
+        finally:
+            self._table.setUpdatesEnabled(True)
+            self._table.blockSignals(False)
+
     def select_all(self) -> None:
-        for fd in self.files:
-            fd["selected"] = True
-        self._rebuild_table()
+        self._set_all_selected(True)
 
     def deselect_all(self) -> None:
-        for fd in self.files:
-            fd["selected"] = False
-        self._rebuild_table()
+        self._set_all_selected(False)
 
     def get_action_target_indices(self) -> List[int]:
         indices = self._selected_row_indices()
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from PyQt6.QtGui import QTextCursor
+from collections import deque
+from typing import Deque
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QShowEvent, QTextCursor
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout
 
 MAX_LINES = 5000
+# Lines arriving within this window are written to the document in one insert.
+FLUSH_INTERVAL_MS = 50
 
 
 class LogViewer(QWidget):
-    """Append-only log view with optional copy."""
+    """Append-only log view with optional copy.
+
+    The document is capped at MAX_LINES blocks (Qt drops the oldest). New lines are queued and
+    written in batches every FLUSH_INTERVAL_MS; while the viewer is hidden (e.g. its tab is not
+    current) the bounded queue just accumulates until it is shown.
+    """
 
     def __init__(self, parent: QWidget | None = None, height: int = 200):
         super().__init__(parent)
@@ -17,28 +28,43 @@ class LogViewer(QWidget):
         self._text.setReadOnly(True)
         self._text.setFixedHeight(height)
         self._text.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self._text.setMaximumBlockCount(MAX_LINES)
+        self._pending: Deque[str] = deque(maxlen=MAX_LINES)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
         lay.addWidget(self._text)
 
     def add_log(self, level: str, message: str) -> None:
-        line = f"[{level}] {message}\n"
+        self._pending.append(f"[{level}] {message}\n")
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start(FLUSH_INTERVAL_MS)
+
+    def _append(self, text: str) -> None:
         self._text.moveCursor(QTextCursor.MoveOperation.End)
-        self._text.insertPlainText(line)
-        doc = self._text.document()
-        if doc.blockCount() > MAX_LINES:
-            cursor = self._text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            for _ in range(doc.blockCount() - MAX_LINES):
-                cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
-                cursor.removeSelectedText()
-                cursor.deleteChar()
+        self._text.insertPlainText(text)
         self._text.moveCursor(QTextCursor.MoveOperation.End)
 
+    def _flush_pending(self) -> None:
+        self._flush_timer.stop()
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._append(text)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self._flush_pending()
+
     def clear(self) -> None:
+        self._flush_timer.stop()
+        self._pending.clear()
         self._text.clear()
 
     def copy_to_clipboard(self) -> None:
+        self._flush_pending()
         self._text.selectAll()
         self._text.copy()
         cur = self._text.textCursor()
@@ -46,4 +72,5 @@ class LogViewer(QWidget):
         self._text.setTextCursor(cur)
 
     def plain_text(self) -> str:
+        self._flush_pending()
         return self._text.toPlainText()
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QFrame, QLabel, QProgressBar, QVBoxLayout
 
+# Progress/status writes are applied at most this often (~30 Hz); only the newest value shows.
+APPLY_INTERVAL_MS = 33
+
 
 class ProgressDisplay(QFrame):
     def __init__(self, parent=None):
@@ -15,16 +21,40 @@ class ProgressDisplay(QFrame):
         lay = QVBoxLayout(self)
         lay.addWidget(self._bar)
         lay.addWidget(self._status)
+        self._pending_value: Optional[int] = None
+        self._pending_status: Optional[str] = None
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.timeout.connect(self._apply_pending)
+
+    def _schedule_apply(self) -> None:
+        if not self._apply_timer.isActive():
+            self._apply_timer.start(APPLY_INTERVAL_MS)
+
+    def _apply_pending(self) -> None:
+        if self._pending_value is not None:
+            self._bar.setValue(self._pending_value)
+            self._pending_value = None
+        if self._pending_status is not None:
+            self._status.setText(self._pending_status)
+            self._pending_status = None
 
     def set_progress(self, percent: float) -> None:
-        self._bar.setValue(int(max(0, min(100, percent))))
+        self._pending_value = int(max(0, min(100, percent)))
+        self._schedule_apply()
 
     def set_status(self, status: str) -> None:
-        self._status.setText(status)
+        self._pending_status = status
+        self._schedule_apply()
 
     def get_status(self) -> str:
+        if self._pending_status is not None:
+            return self._pending_status
         return self._status.text()
 
     def reset(self) -> None:
+        self._apply_timer.stop()
+        self._pending_value = None
+        self._pending_status = None
         self._bar.setValue(0)
         self._status.setText("Ready")
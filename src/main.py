@@ -3,22 +3,28 @@
 import sys
 from pathlib import Path
 
-from PyQt6.QtWidgets import QApplication
-
-from utils.config import config
-
 if getattr(sys, "frozen", False):
     base_path = sys._MEIPASS
 else:
     base_path = str(Path(__file__).parent)
     sys.path.insert(0, base_path)
 
-from gui.main_window import MainWindow
-from gui.styles import get_stylesheet
-from utils.logger import logger
-
 
 def main() -> None:
+    if "--version" in sys.argv[1:]:
+        from utils.app_version import get_app_version
+
+        print(get_app_version())
+        return
+
+    # Qt, the GUI modules and logging setup load here, not at import time.
+    from PyQt6.QtWidgets import QApplication
+
+    from gui.main_window import MainWindow
+    from gui.styles import get_stylesheet
+    from utils.config import config
+    from utils.logger import logger
+
     try:
         logger.info("Starting Video Encoder GUI (PyQt6)")
         app = QApplication(sys.argv)
@@ -30,7 +36,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         raise
     finally:
         config.flush()
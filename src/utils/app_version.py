@@ -16,7 +16,7 @@ def _read_version_from_src_init() -> str | None:
         for line in init_file.read_text(encoding="utf-8").splitlines():
             stripped = line.strip()
             if stripped.startswith("__version__"):
-                return stripped.split("=", 1)[1].strip().strip('"').strip("'")
+                return stripped.split("=", 1)[1].strip().strip("\"'")
     except Exception:
         pass
     return None
@@ -19,6 +19,13 @@ from utils.output_container import (
 
 CONFIG_SAVE_DEBOUNCE_SEC = 0.4
 
+# Try to import orjson for faster config.json parse/dump (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class Config:
     """Manages application configuration"""
@@ -46,14 +53,21 @@ class Config:
         self._save_lock = threading.Lock()
         self._dirty = False
         self._save_timer: Optional[threading.Timer] = None
+        # Lowercased language-tag sets derived from the lists; dropped on every set()/load.
+        self._tag_sets: Dict[str, frozenset] = {}
         self._load()
     
     def _load(self):
         """Load configuration from file"""
+        self._tag_sets = {}
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                if HAS_ORJSON:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    self.config = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        self.config = json.load(f)
                 if not isinstance(self.config, dict):
                     self.config = {}
             except (json.JSONDecodeError, OSError, UnicodeError):
@@ -78,6 +92,7 @@ class Config:
             "default_output_container": "mp4",
             "strip_leading_path_segments": 0,
             "encoding_mode": "sequential",
+            "x264_preset": "medium",
             "last_scan_folder": "",
             "skip_existing": False,
             "debug_logging": False,
@@ -195,14 +210,30 @@ class Config:
             fmt = hb.get("format", "av_mp4") if isinstance(hb, dict) else "av_mp4"
             self.config["default_output_container"] = default_container_from_handbrake_format(fmt)
 
+    def _dump_config_bytes(self) -> bytes:
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. integers past 64 bits; stdlib json still handles them
+        return json.dumps(self.config, indent=2).encode('utf-8')
+
     def _write_config_file_locked(self) -> None:
         """Persist config; caller must hold _save_lock."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # leaves a truncated config.json behind.
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(self._dump_config_bytes())
+            os.replace(tmp_file, self.config_file)
         except OSError as e:
             print(f"Error saving config: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
 
     def _schedule_save(self) -> None:
         with self._save_lock:
@@ -251,6 +282,7 @@ class Config:
     def set(self, key: str, value: Any):
         """Set a configuration value; persists after a short debounce or on flush()."""
         self.config[key] = value
+        self._tag_sets.clear()
         self._schedule_save()
     
     # -----------------------------------------------------------------------
@@ -363,6 +395,14 @@ class Config:
         """Set encoding mode preference"""
         self.set("encoding_mode", mode)
     
+    def get_x264_preset(self) -> str:
+        """Get the -preset used for libx264/libx265 commands that do not set one"""
+        return self.get("x264_preset", "medium")
+    
+    def set_x264_preset(self, preset: str):
+        """Set the -preset used for libx264/libx265 commands that do not set one"""
+        self.set("x264_preset", preset)
+    
     def get_last_scan_folder(self) -> str:
         """Get last used scan folder"""
         return self.get("last_scan_folder", "")
@@ -501,6 +541,10 @@ class Config:
     def set_audio_language_tags(self, tags: list):
         """Set audio language tags to match"""
         self.set("audio_language_tags", tags)
+
+    def get_audio_language_tag_set(self) -> frozenset:
+        """Lowercased audio language tags for membership tests"""
+        return self._language_tag_set("audio_language_tags")
     
     def get_audio_name_patterns(self) -> list:
         """Get audio name patterns to match"""
@@ -529,6 +573,17 @@ class Config:
     def set_subtitle_language_tags(self, tags: list):
         """Set subtitle language tags to match"""
         self.set("subtitle_language_tags", tags)
+
+    def get_subtitle_language_tag_set(self) -> frozenset:
+        """Lowercased subtitle language tags for membership tests"""
+        return self._language_tag_set("subtitle_language_tags")
+
+    def _language_tag_set(self, key: str) -> frozenset:
+        cached = self._tag_sets.get(key)
+        if cached is None:
+            cached = frozenset(str(tag).lower() for tag in self.get(key, ["en", "eng"]))
+            self._tag_sets[key] = cached
+        return cached
     
     def get_subtitle_name_patterns(self) -> list:
         """Get subtitle name patterns to match"""
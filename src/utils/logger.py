@@ -1,107 +1,272 @@
 """Logging utilities"""
 
+import atexit
 import logging
+import os
+import queue
+import sys
 import threading
+import time
 from collections import deque
-from datetime import datetime
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
 LOG_BUFFER_MAXLEN = 10_000
+# Attribute on the "VideoEncoder" logging.Logger naming the Logger that installed its handlers.
+_INSTALLED_ATTR = "_video_encoder_app_logger"
+LOG_FILE_BUFFER_BYTES = 64 * 1024
+# Buffered file output is flushed once this much is pending or this long after the
+# oldest unflushed record (an idle timer covers quiet periods), and at once for
+# warnings and errors.
+LOG_FILE_FLUSH_SIZE = 32 * 1024
+LOG_FILE_FLUSH_INTERVAL_SEC = 1.0
+
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """Log file handler that lets a 64 KB buffer fill instead of flushing after every record
+
+    The directory and file are created on the first record, so importing the logger
+    without logging anything touches no files.
+    """
+
+    def __init__(self, log_file: Path):
+        super().__init__()
+        self.stream = None
+        self.log_file = log_file
+        self.open_failed = False
+        # monotonic() time of the oldest record written since the last flush.
+        self._oldest_unflushed: Optional[float] = None
+        self._unflushed = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def _open(self) -> bool:
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            # Binary: records are encoded once in emit, skipping the TextIOWrapper layer.
+            self.stream = open(self.log_file, 'ab', buffering=LOG_FILE_BUFFER_BYTES)
+        except OSError as e:
+            # Continue with console-only logging
+            self.open_failed = True
+            print(f"Warning: Failed to initialize file logging: {e}", file=sys.stderr)
+            print(f"Log directory attempted: {self.log_file.parent}", file=sys.stderr)
+            return False
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None and (self.open_failed or not self._open()):
+            return
+        try:
+            text = self.format(record) + self.terminator
+            if os.linesep != "\n":
+                # Keep the platform line endings text mode used to write (CRLF on Windows).
+                text = text.replace("\n", os.linesep)
+            data = text.encode('utf-8')
+            self.stream.write(data)
+        except Exception:
+            self.handleError(record)
+            return
+        now = time.monotonic()
+        if self._oldest_unflushed is None:
+            self._oldest_unflushed = now
+        self._unflushed += len(data)
+        if (
+            record.levelno >= logging.WARNING
+            or self._unflushed >= LOG_FILE_FLUSH_SIZE
+            or now - self._oldest_unflushed >= LOG_FILE_FLUSH_INTERVAL_SEC
+        ):
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(LOG_FILE_FLUSH_INTERVAL_SEC, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._cancel_flush_timer()
+            super().flush()
+            self._unflushed = 0
+            self._oldest_unflushed = None
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            self._cancel_flush_timer()
+            stream, self.stream = self.stream, None
+            if stream is not None:
+                try:
+                    stream.flush()
+                finally:
+                    stream.close()
+        finally:
+            self.release()
+            super().close()
+
+
+# Marks records from Logger.success(); they log at INFO with a "SUCCESS: " prefix.
+_SUCCESS_EXTRA = {"success": True}
+
+
+class _QueueFormatter(logging.Formatter):
+    """Formats the message once in the QueueHandler, adding the success prefix"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        return f"SUCCESS: {message}" if getattr(record, "success", False) else message
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Reuses the asctime text for records logged within the same second (datefmt has no sub-second fields)"""
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._last_second: Optional[int] = None
+        self._last_asctime = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_asctime
+
+
+class _RingBufferHandler(logging.Handler):
+    """Keeps the latest (level, message) pairs for the Debug tab's session log"""
+
+    def __init__(self, maxlen: int):
+        super().__init__(logging.DEBUG)
+        self.buffer: deque = deque(maxlen=maxlen)
+
+    def emit(self, record: logging.LogRecord):
+        level = "SUCCESS" if getattr(record, "success", False) else record.levelname
+        # The QueueHandler (installed first) has already formatted this record and left
+        # the text on record.message, so reuse it rather than %-formatting again.
+        message = getattr(record, "message", None)
+        self.buffer.append((level, message if message is not None else record.getMessage()))
 
 
 class Logger:
-    """Application logger with file and console output"""
+    """Application logger with file and console output
+
+    Messages take %-style args like the logging module (``logger.info("Encoded %s", name)``),
+    so the string is built once inside logging rather than at the call site.
+    Callers only enqueue records; a QueueListener thread formats and writes them,
+    so logging from the encoder threads never waits on file or console I/O.
+
+    Handlers are installed once per process: a later Logger() (or a second import of
+    this module under another name) shares the first one's file, buffer and listener,
+    and its arguments are ignored.
+    """
     
-    def __init__(self, log_dir: Optional[Path] = None):
+    def __init__(self, log_dir: Optional[Path] = None, max_buffer: int = LOG_BUFFER_MAXLEN):
         # Setup logger
         self.logger = logging.getLogger("VideoEncoder")
+        installed = getattr(self.logger, _INSTALLED_ATTR, None)
+        if installed is not None:
+            # Adding a second handler set would write every line twice.
+            self.__dict__.update(installed.__dict__)
+            return
         self.logger.setLevel(logging.DEBUG)
+        # Records stop here; a handler on the root logger must not emit them again.
+        self.logger.propagate = False
         
         # Determine log directory
         if log_dir is None:
             log_dir = Path.home() / ".video_encoder" / "logs"
         
-        # Create log directory with error handling
-        log_file = None
-        try:
-            log_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create log file with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            log_file = log_dir / f"encode-{timestamp}.log"
-            
-            # File handler
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter(
-                '[%(asctime)s] [%(levelname)s] %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
-        except OSError as e:
-            import sys
-            print(f"Warning: Failed to initialize file logging: {e}", file=sys.stderr)
-            print(f"Log directory attempted: {log_dir}", file=sys.stderr)
-            # Continue with console-only logging
-            log_file = None
+        # Log file with timestamp; the handler creates it on the first record
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        log_file = log_dir / f"encode-{timestamp}.log"
+        file_handler = _BufferedFileHandler(log_file)
+        file_handler.setLevel(logging.DEBUG)
+        file_formatter = _CachedTimeFormatter(
+            '[%(asctime)s] [%(levelname)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
         
         # Console handler (always available as fallback)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter('%(message)s')
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+
+        handlers = [file_handler, console_handler]
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(self._queue)
+        queue_handler.setFormatter(_QueueFormatter())
+        self.logger.addHandler(queue_handler)
+        self._listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        # Registered after logging's own shutdown hook, so it runs first and drains the queue.
+        atexit.register(self._listener.stop)
         
+        # The session buffer is filled by the same dispatch, on the caller's thread,
+        # so get_recent_logs() sees a record as soon as the call returns.
+        self._ring = _RingBufferHandler(max_buffer)
+        self.logger.addHandler(self._ring)
+
         self.log_file = log_file
-        self._log_buffer: deque = deque(maxlen=LOG_BUFFER_MAXLEN)
-        self._buffer_lock = threading.Lock()
+        self._file_handler = file_handler
+        setattr(self.logger, _INSTALLED_ATTR, self)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log info message"""
-        self.logger.info(message)
-        with self._buffer_lock:
-            self._log_buffer.append(("INFO", message))
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message"""
-        self.logger.warning(message)
-        with self._buffer_lock:
-            self._log_buffer.append(("WARNING", message))
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message"""
-        self.logger.error(message)
-        with self._buffer_lock:
-            self._log_buffer.append(("ERROR", message))
+        self.logger.error(message, *args)
     
-    def success(self, message: str):
+    def success(self, message: str, *args):
         """Log success message"""
-        self.logger.info(f"SUCCESS: {message}")
-        with self._buffer_lock:
-            self._log_buffer.append(("SUCCESS", message))
+        self.logger.info(message, *args, extra=_SUCCESS_EXTRA)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log debug message"""
-        self.logger.debug(message)
-        with self._buffer_lock:
-            self._log_buffer.append(("DEBUG", message))
+        self.logger.debug(message, *args)
     
     def get_log_file(self) -> Optional[Path]:
-        """Get the log file path"""
-        return self.log_file
+        """Get the log file path (buffered lines are flushed first so the file is current)"""
+        self.flush()
+        return None if self._file_handler.open_failed else self.log_file
+
+    def flush(self):
+        """Write buffered log file output to disk (records still queued follow moments later)"""
+        self._file_handler.flush()
     
     def get_recent_logs(self, count: int = 100) -> list:
         """Get recent log entries"""
-        with self._buffer_lock:
-            buf = list(self._log_buffer)
-        return buf[-count:]
+        # Walk back from the newest entry so only `count` items are copied, not the whole buffer.
+        self._ring.acquire()
+        try:
+            recent = list(islice(reversed(self._ring.buffer), max(count, 0)))
+        finally:
+            self._ring.release()
+        recent.reverse()
+        return recent
     
     def clear_buffer(self):
         """Clear the log buffer"""
-        with self._buffer_lock:
-            self._log_buffer.clear()
+        self._ring.acquire()
+        try:
+            self._ring.buffer.clear()
+        finally:
+            self._ring.release()
 
 
 # Global logger instance
@@ -0,0 +1,216 @@
+"""Tests for FFmpeg command template substitution."""
+
+import shlex
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gui.tabs.ffmpeg_command_util import (
+    _split_template,
+    _strip_windows_shlex_outer_quotes,
+    _tokenize_template,
+    generate_command_preview,
+    parse_and_substitute_command,
+)
+
+
+class TestParseAndSubstituteCommand(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.src = root / "my show.mkv"
+        self.src.write_bytes(b"")
+        self.out = root / "out dir" / "my show-x.mp4"
+        self.logs = []
+        patcher = patch("gui.tabs.ffmpeg_command_util.config")
+        self.cfg = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cfg.get_ffmpeg_path.return_value = ""
+
+    def _parse(self, template, audio=1, sub_track=None, sub_file=None, stream_index=None):
+        return parse_and_substitute_command(
+            template,
+            self.src,
+            self.out,
+            audio,
+            sub_track,
+            sub_file,
+            lambda level, msg: self.logs.append((level, msg)),
+            audio_ffmpeg_stream_index=stream_index,
+        )
+
+    def test_brace_placeholders_and_map_rewrite(self):
+        sub_file = Path(self._tmp.name) / "s:ub.mkv"
+        args = self._parse(
+            "ffmpeg -i {INPUT} -map 0:v:0 -map 0:{AUDIO_TRACK} -c:a:0 copy "
+            "-vf \"scale=1280:-2:si=1,subtitles='{SUBTITLE_FILE}'\" {OUTPUT}",
+            audio=2,
+            sub_track=3,
+            sub_file=sub_file,
+            stream_index=5,
+        )
+        self.assertEqual(
+            args,
+            [
+                "ffmpeg", "-i", str(self.src), "-map", "0:v:0", "-map", "0:5",
+                "-c:a:0", "copy", "-vf",
+                f"scale=1280:-2,subtitles='{Path(self._tmp.name).as_posix()}/s\\:ub.mkv'",
+                str(self.out),
+            ],
+        )
+
+    def test_example_paths_and_missing_subtitle_file_drops_filter(self):
+        args = self._parse(
+            "ffmpeg -i input.mkv -map 0:a:{AUDIO_TRACK} "
+            "-vf \"scale=1280:-2,subtitles='{SUBTITLE_FILE}'\" output.mp4",
+            audio=2,
+        )
+        self.assertEqual(
+            args,
+            ["ffmpeg", "-i", str(self.src), "-map", "0:a:1", "-vf", "scale=1280:-2", str(self.out)],
+        )
+
+    def test_angle_placeholders_and_unknown_placeholder_warning(self):
+        args = self._parse("ffmpeg -i <INPUT> -x <SUBTITLE_TRACK> {FOO} <OUTPUT>", sub_track=0)
+        self.assertEqual(args, ["ffmpeg", "-i", str(self.src), "-x", "0", "{FOO}", str(self.out)])
+        self.assertEqual(len(self.logs), 1)
+        self.assertEqual(self.logs[0][0], "WARNING")
+        self.assertIn("{FOO}", self.logs[0][1])
+
+    def test_substituted_paths_are_not_substituted_again(self):
+        self.src = Path(self._tmp.name) / "output.mp4 notes.mkv"
+        self.src.write_bytes(b"")
+        args = self._parse("ffmpeg -i input.mkv output.mp4")
+        self.assertEqual(args, ["ffmpeg", "-i", str(self.src), str(self.out)])
+
+    def test_configured_ffmpeg_replaces_first_argument(self):
+        self.cfg.get_ffmpeg_path.return_value = "/opt/ff/ffmpeg"
+        args = self._parse("ffmpeg -i {INPUT} {OUTPUT}")
+        self.assertEqual(args[0], "/opt/ff/ffmpeg")
+
+    def test_explicit_ffmpeg_path_skips_config(self):
+        args = parse_and_substitute_command(
+            "ffmpeg -i {INPUT} {OUTPUT}", self.src, self.out, 1, None, None,
+            self.logs.append, ffmpeg_path="/opt/ff/ffmpeg",
+        )
+        self.assertEqual(args[0], "/opt/ff/ffmpeg")
+        self.cfg.get_ffmpeg_path.assert_not_called()
+
+    def test_rejects_non_ffmpeg_executable(self):
+        with self.assertRaises(ValueError):
+            self._parse("rm -i {INPUT} {OUTPUT}")
+
+    def test_whole_token_template_uses_cached_tokens(self):
+        template = (
+            "ffmpeg -i {INPUT} -map 0:v:0 -map 0:{AUDIO_TRACK} -map 0:a:{AUDIO_TRACK} "
+            "-vf \"scale=1280:-2:si=1\" -y {OUTPUT}"
+        )
+        self.assertIsNotNone(_tokenize_template(template))
+        args = self._parse(template, audio=3)
+        self.assertEqual(
+            args,
+            [
+                "ffmpeg", "-i", str(self.src), "-map", "0:v:0", "-map", "0:2",
+                "-map", "0:a:2", "-vf", "scale=1280:-2", "-y", str(self.out),
+            ],
+        )
+
+    def test_embedded_placeholder_substituted_within_its_token(self):
+        tokens = _tokenize_template("ffmpeg -i {INPUT} -map 0:s:{SUBTITLE_TRACK} {OUTPUT}")
+        self.assertEqual(tokens[4], ("0:s:{SUBTITLE_TRACK}", "EMBEDDED"))
+        args = self._parse("ffmpeg -i {INPUT} -map 0:s:{SUBTITLE_TRACK} {OUTPUT}", sub_track=4)
+        self.assertEqual(args, ["ffmpeg", "-i", str(self.src), "-map", "0:s:4", str(self.out)])
+
+    def test_argv_template_matches_string_template(self):
+        argv = [
+            "ffmpeg", "-i", "input.mkv", "-map", "0:v:0", "-map", "0:1",
+            "-vf", "scale=1280:-2:si=1,subtitles='{SUBTITLE_FILE}'", "-c:a", "aac", "output.mp4",
+        ]
+        template = " ".join(f'"{a}"' if " " in a else a for a in argv)
+        sub_file = Path(self._tmp.name) / "sub.mkv"
+        expected = self._parse(template, audio=2, sub_file=sub_file, stream_index=3)
+        args = parse_and_substitute_command(
+            template, self.src, self.out, 2, None, sub_file, self.logs.append,
+            audio_ffmpeg_stream_index=3, argv_template=argv,
+        )
+        self.assertEqual(args, expected)
+        self.assertEqual(args[6], "0:3")
+
+    def test_space_after_audio_stream_colon(self):
+        for template in (
+            "ffmpeg -i {INPUT} -map 0:a: {AUDIO_TRACK} {OUTPUT}",
+            "ffmpeg -i {INPUT} -map 0:a: <AUDIO_TRACK> {OUTPUT}",
+        ):
+            args = self._parse(template, audio=2)
+            self.assertEqual(args, ["ffmpeg", "-i", str(self.src), "-map", "0:a:1", str(self.out)], template)
+        args = parse_and_substitute_command(
+            "", self.src, self.out, 2, None, None, self.logs.append,
+            argv_template=["ffmpeg", "-i", "{INPUT}", "-map", "0:a:", "{AUDIO_TRACK}", "{OUTPUT}"],
+        )
+        self.assertEqual(args[3:5], ["-map", "0:a:1"])
+
+    def test_unbalanced_quotes_return_empty(self):
+        self.assertEqual(self._parse('ffmpeg -i {INPUT} -vf "scale=1280:-2 {OUTPUT}'), [])
+        self.assertEqual(self.logs[-1][0], "ERROR")
+
+    def test_missing_input_returns_empty(self):
+        self.src.unlink()
+        self.assertEqual(self._parse("ffmpeg -i {INPUT} {OUTPUT}"), [])
+
+
+class TestSplitTemplate(unittest.TestCase):
+    def test_matches_shlex_non_posix(self):
+        for template in (
+            'ffmpeg -i "{INPUT}" -vf "scale=1:2,subtitles=\'{SUBTITLE_FILE}\'" {OUTPUT}',
+            "ffmpeg -i 'a b.mkv' -metadata title=\"x y\" \"q\"tail\t-y\n out.mp4",
+            '  -c:v libx264  "" \'\' ',
+        ):
+            expected = [_strip_windows_shlex_outer_quotes(t) for t in shlex.split(template, posix=False)]
+            self.assertEqual(_split_template(template), expected, template)
+
+    def test_unclosed_quote_raises(self):
+        with self.assertRaises(ValueError):
+            _split_template('ffmpeg -vf "scale=1:2')
+
+
+class TestGenerateCommandPreview(unittest.TestCase):
+    TEMPLATE = (
+        "ffmpeg -i {INPUT} -map 0:v:0 -map 0:{AUDIO_TRACK} -map 0:a:<AUDIO_TRACK> "
+        "-s <SUBTITLE_TRACK> -vf \"scale=1:2,subtitles='{SUBTITLE_FILE}'\" <OUTPUT>"
+    )
+
+    def setUp(self):
+        patcher = patch("gui.tabs.ffmpeg_command_util.config")
+        self.cfg = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cfg.get_output_file_extension.return_value = ".mp4"
+        self.cfg.get_ffmpeg_path.return_value = ""
+        self.src = Path("/media/my show/ep1.mkv")
+
+    def _preview(self, subtitle_track):
+        files = [{"path": self.src, "audio_track": 2, "subtitle_track": subtitle_track}]
+        return generate_command_preview(
+            self.TEMPLATE, lambda: files, lambda p: Path("/out dir"), "_x"
+        )
+
+    def test_placeholders_without_subtitle_track(self):
+        self.assertEqual(
+            self._preview(None),
+            f'ffmpeg -i "{self.src}" -map 0:v:0 -map 0:1 -map 0:a:1 -s <SUBTITLE_TRACK> '
+            f"-vf \"scale=1:2,subtitles='{{SUBTITLE_FILE}}'\" \"{Path('/out dir/ep1_x.mp4')}\"",
+        )
+
+    def test_subtitle_track_and_file_are_filled(self):
+        preview = self._preview(3)
+        self.assertIn("-s 3 ", preview)
+        self.assertIn("ep1_subtitle.mkv'", preview)
+        self.assertNotIn("SUBTITLE", preview)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for the video file scanner."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.file_scanner import FileScanner, _format_file_size
+
+
+class TestIterDirectorySizes(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        (self.root / "a.mkv").write_bytes(b"x" * 3)
+        (self.root / "notes.txt").write_bytes(b"skip")
+        (self.root / "sub" / "deep").mkdir(parents=True)
+        (self.root / "sub" / "B.MP4").write_bytes(b"x" * 5)
+        (self.root / "sub" / "deep" / "c.avi").write_bytes(b"")
+        (self.root / "sub" / "folder.mkv").mkdir()
+        self.scanner = FileScanner()
+
+    def test_matches_iter_directory_with_sizes(self):
+        for recursive in (True, False):
+            found = dict(self.scanner.iter_directory_sizes(self.root, recursive))
+            self.assertEqual(sorted(found), sorted(self.scanner.iter_directory(self.root, recursive)))
+            self.assertEqual(found, {p: self.scanner.get_file_size(p) for p in found})
+
+    def test_recursive_sizes(self):
+        found = dict(self.scanner.iter_directory_sizes(self.root))
+        self.assertEqual(
+            found,
+            {
+                self.root / "a.mkv": 3,
+                self.root / "sub" / "B.MP4": 5,
+                self.root / "sub" / "deep" / "c.avi": 0,
+            },
+        )
+
+    def test_missing_directory_yields_nothing(self):
+        self.assertEqual(list(self.scanner.iter_directory_sizes(self.root / "nope")), [])
+
+
+class TestFormatFileSize(unittest.TestCase):
+    def test_units(self):
+        scanner = FileScanner()
+        self.assertEqual(scanner.format_file_size(0), "0.00 B")
+        self.assertEqual(scanner.format_file_size(1536), "1.50 KB")
+        self.assertEqual(scanner.format_file_size(5 * 1024 ** 3), "5.00 GB")
+
+    def test_repeated_size_is_memoized(self):
+        scanner = FileScanner()
+        scanner.format_file_size(7 * 1024 ** 2)
+        hits = _format_file_size.cache_info().hits
+        self.assertEqual(scanner.format_file_size(7 * 1024 ** 2), "7.00 MB")
+        self.assertEqual(_format_file_size.cache_info().hits, hits + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
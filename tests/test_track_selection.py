@@ -1,13 +1,16 @@
 """Tests for audio track selection (issue #2: untagged single audio, HandBrake index)."""
 
+import subprocess
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.track_analyzer import TrackAnalyzer
+from core.track_analyzer import TrackAnalyzer, _language_matches
+from core.track_cache import TrackCache
 from core.track_selection import (
     audio_mkv_stream_id_for_ordinal,
     compute_effective_tracks,
@@ -61,6 +64,60 @@ class TestTrackSelection(unittest.TestCase):
             audio, _sub = compute_effective_tracks(tracks, self.analyzer)
         self.assertIsNone(audio)
 
+    def test_analyze_with_output_runs_mkvinfo_once_and_caches(self):
+        analyzer = TrackAnalyzer(mkvinfo_path="mkvinfo")
+        lines = _DOC_BROWN_MKVINFO.splitlines(keepends=True)
+        streamed: list[str] = []
+        replayed: list[str] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            sample = Path(tmp) / "sample.mkv"
+            sample.write_bytes(b"")
+            store = TrackCache(Path(tmp) / "track_cache.json")
+            with patch.object(analyzer, "iter_mkvinfo_output", side_effect=lambda _p: (line for line in lines)) as run, \
+                    patch("core.track_analyzer.track_cache", store):
+                raw, tracks = analyzer.analyze_with_output(sample, streamed.append)
+                again = analyzer.analyze_with_output(sample, replayed.append)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(streamed, lines)
+        self.assertEqual(replayed, lines)
+        self.assertEqual(raw, _DOC_BROWN_MKVINFO)
+        self.assertEqual(tracks["first_audio"], 1)
+        self.assertEqual(again, (raw, tracks))
+
+    def test_analyze_with_output_runs_mkvinfo_for_non_mkv(self):
+        analyzer = TrackAnalyzer(mkvinfo_path="mkvinfo")
+        fallback = {"audio": None, "subtitle": None, "error": None}
+        with tempfile.TemporaryDirectory() as tmp:
+            sample = Path(tmp) / "sample.mp4"
+            sample.write_bytes(b"")
+            with patch.object(analyzer, "iter_mkvinfo_output", side_effect=lambda _p: (line for line in ["+ EBML head\n"])) as run, \
+                    patch.object(analyzer, "analyze_tracks", return_value=fallback):
+                raw, tracks = analyzer.analyze_with_output(sample)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(raw, "+ EBML head\n")
+        self.assertIs(tracks, fallback)
+
+    def test_persisted_track_list_skips_mkvinfo_for_unchanged_file(self):
+        done = subprocess.CompletedProcess([], 0, stdout=_DOC_BROWN_MKVINFO, stderr="")
+        with tempfile.TemporaryDirectory() as tmp:
+            sample = Path(tmp) / "sample.mkv"
+            sample.write_bytes(b"")
+            cache_file = Path(tmp) / "track_cache.json"
+            store = TrackCache(cache_file)
+            with patch("core.track_analyzer.subprocess.run", return_value=done) as run, \
+                    patch("core.track_analyzer.track_cache", store):
+                first = TrackAnalyzer(mkvinfo_path="mkvinfo").analyze_tracks(sample)
+                store.flush()
+            reloaded = TrackCache(cache_file)
+            with patch("core.track_analyzer.subprocess.run", return_value=done) as run2, \
+                    patch("core.track_analyzer.track_cache", reloaded):
+                second = TrackAnalyzer(mkvinfo_path="mkvinfo").analyze_tracks(sample)
+                sample.write_bytes(b"changed")
+                TrackAnalyzer(mkvinfo_path="mkvinfo").analyze_tracks(sample)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(run2.call_count, 1)
+        self.assertEqual(second, first)
+
     @unittest.skipUnless(
         Path(__file__).parent.parent.joinpath("2015 Message from Doc Brown.mkv").is_file(),
         "sample MKV not present",
@@ -75,5 +132,66 @@ class TestTrackSelection(unittest.TestCase):
         self.assertEqual(handbrake_audio_track_index(audio), 1)
 
 
+class TestIterMkvinfoOutput(unittest.TestCase):
+    """Runs a Python script in place of mkvinfo (the file argument is the script)."""
+
+    def _lines(self, body, timeout=5):
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "fake_mkvinfo.py"
+            script.write_text(body)
+            seen = []
+            try:
+                for line in TrackAnalyzer(mkvinfo_path=sys.executable).iter_mkvinfo_output(
+                    script, timeout=timeout
+                ):
+                    seen.append(line)
+            except subprocess.SubprocessError as e:
+                return seen, e
+            return seen, None
+
+    def test_yields_lines_in_order(self):
+        seen, error = self._lines("print('+ EBML head')\nprint('|+ Segment')\n")
+        self.assertEqual(seen, ["+ EBML head\n", "|+ Segment\n"])
+        self.assertIsNone(error)
+
+    def test_hung_mkvinfo_is_killed_after_timeout(self):
+        seen, error = self._lines(
+            "import time\nprint('+ EBML head', flush=True)\ntime.sleep(30)\n", timeout=0.5
+        )
+        self.assertEqual(seen, ["+ EBML head\n"])
+        self.assertIsInstance(error, subprocess.TimeoutExpired)
+
+    def test_failed_run_raises_after_its_output(self):
+        seen, error = self._lines("print('Error: not a Matroska file')\nraise SystemExit(2)\n")
+        self.assertEqual(seen, ["Error: not a Matroska file\n"])
+        self.assertIsInstance(error, subprocess.CalledProcessError)
+
+
+class TestCompiledRegexes(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = TrackAnalyzer()
+
+    def test_plain_patterns_fold_into_one_alternation(self):
+        with self.assertLogs("core.track_analyzer", level="WARNING"):
+            regexes = self.analyzer._compiled_regexes(["Signs$", "English\\[Signs\\]", "(", "JPN"])
+        self.assertEqual(len(regexes), 1)
+        self.assertTrue(regexes[0].search("english[signs]"))
+        self.assertTrue(regexes[0].search("Full Signs"))
+        self.assertFalse(regexes[0].search("Signs & Songs"))
+
+    def test_grouped_or_flagged_patterns_stay_separate(self):
+        self.assertEqual(len(self.analyzer._compiled_regexes(["(a)\\1", "b"])), 2)
+        self.assertEqual(len(self.analyzer._compiled_regexes(["(?s)a", "b"])), 2)
+
+
+class TestLanguageMatches(unittest.TestCase):
+    def test_exact_and_prefix_before_separator(self):
+        tags = frozenset({"en", "eng", "pt-br"})
+        for language in ("ENG", "eng-eng", "en_US", "pt-BR", "pt-br-x"):
+            self.assertTrue(_language_matches(language, tags), language)
+        for language in ("english", "enm", "pt", "jpn-eng"):
+            self.assertFalse(_language_matches(language, tags), language)
+
+
 if __name__ == "__main__":
     unittest.main()